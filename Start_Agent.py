@@ -3,11 +3,19 @@ import sys
 import threading
 import asyncio
 import logging
+import logging.handlers
+import operator
 import time
 import re
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import count, islice
 from datetime import datetime
-from queue import Queue, Empty
-from typing import Optional, Any, List
+from functools import partial
+from queue import Queue, Full
+from typing import TYPE_CHECKING, Optional, Any, Dict, List, Tuple
 
 from dotenv import load_dotenv
 
@@ -16,9 +24,14 @@ project_root = current_dir
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+CHATBOT_UI_SCRIPT = os.path.join(project_root, "src", "chatbot_ui.py")
+CHATBOT_UI_EXISTS = os.path.exists(CHATBOT_UI_SCRIPT)
+
 load_dotenv()
 
 import subprocess
+import tkinter as tk
+import tkinter.font as tkfont
 import customtkinter as ctk
 from customtkinter import CTkInputDialog
 
@@ -28,13 +41,9 @@ from src.user_profile import load_user_profile, save_user_profile
 
 from src import diagnostics
 
-from src.agent import create_axylo_agent
-from src.agent import _shorten_text, _sanitize_for_speech
-from src.voice_io import VoiceHandler
-from src.voice_typing import start_voice_typing
-from src.voice_messaging import start_voice_messaging
-from src.smart_writer import handle_smart_ai_writing
-from google.adk.runners import InMemoryRunner
+if TYPE_CHECKING:
+    from google.adk.runners import InMemoryRunner
+    from src.voice_io import VoiceHandler
 
 BG_MAIN = "#020617"            
 PANEL_MAIN = "#0F172A"        
@@ -52,45 +61,143 @@ TITLE_FONT = ("Segoe UI", 20, "bold")
 SUBTITLE_FONT = ("Segoe UI", 11)
 MSG_FONT = ("Consolas", 13)
 META_FONT = ("Segoe UI", 9)
+BUBBLE_WRAP_PX = 420
+
+MAX_LOG_LINES = 5000
+LOG_POLL_MIN_MS = 16
+LOG_POLL_MAX_MS = 500
+LOG_POLL_BURST_LINES = 10
+LOG_VIEW_WINDOW = 500
+LOG_QUEUE_MAXSIZE = 4096
+UI_FLUSH_MS = 150
+DUPLICATE_BOT_MSG_WINDOW_S = 1.0
+
+# Prebuilt UI states posted from the agent thread via _queue_ui, so the hot loop
+# hands over a shared constant instead of building a closure per update.
+STATUS_ONLINE = ("Online • Listening…", "#22C55E")
+STATUS_LISTENING = ("Listening…", "#60A5FA")
+STATUS_MIC_MUTED = ("Online • Mic muted", "#FACC15")
+STATUS_THINKING = ("Thinking…", "#F97316")
+STATUS_VOICE_TYPING = ("Voice typing session…", "#60A5FA")
+STATUS_VOICE_MESSAGING = ("Voice messaging session…", "#60A5FA")
+STATUS_STOPPED = ("Idle • Agent stopped", "#FACC15")
+LLM_IDLE = ("idle",)
+LLM_THINKING = ("thinking",)
+TTS_OK = (False,)
+TTS_ERROR = (True,)
+
+LOG_FILTER_TOKENS = {
+    "User": "[USER]",
+    "Agent": "[AGENT]",
+    "Voice": "[VOICE]",
+    "Tools": "[TOOLS]",
+    "Search": "[SEARCH]",
+    "Error": "ERROR",
+}
+
+# Same pattern as main.py so both entry points shut down on the same phrases.
+_SHUTDOWN_RE = re.compile(r"\b(?:bye(?:[- ]?bye)?|shut[- ]?down)\b")
+_VOICE_TYPING_PHRASES = frozenset(("voice typing", "start voice typing"))
+_SEND_MESSAGE_PREFIXES = ("send a message", "send message")
+
+# Request ids only need to be unique within a run; seeding with the pid keeps
+# them distinct across restarts that share a log file.
+_REQ_COUNTER = count((os.getpid() << 20) + 1)
+
+_PROFILE_FIELDS = (
+    ("name", "Name:"),
+    ("age", "Age:"),
+    ("role", "Role:"),
+    ("location", "Location:"),
+    ("notes", "Notes:"),
+)
+
+_DIAG_ICONS = {
+    "ok": "✅",
+    "warning": "⚠️",
+    "error": "❌",
+    "info": "ℹ️",
+}
+
+_CODE_FENCE_RE = re.compile(r"```.*?```", re.DOTALL)
+_INDENT_RE = re.compile(r"(^|\n)( {4,}.*)")
 
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
 
+@dataclass
+class MessageData:
+    """
+    Lightweight chat message record. The message store is the source of truth
+    for the transcript; the chat widget only holds rendered text.
+    """
+    sender: str
+    text: str
+    ts: str
+
 class GuiLogHandler(logging.Handler):
     """
     Logging handler that pushes formatted log lines into a thread-safe queue.
     GUI polls this queue and appends to the log panel.
+    Runs on the QueueListener thread, so formatting never blocks the logging caller.
+    If the GUI falls behind and the queue is full, lines are dropped and counted.
     """
 
     def __init__(self, queue: Queue, level=logging.INFO):
         super().__init__(level=level)
         self.queue = queue
+        self.dropped = 0
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            msg = self.format(record)
+            line = self.format(record)
         except Exception:
-            msg = record.getMessage()
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        line = f"[{timestamp}] [{record.levelname}] {msg}"
+            line = f"[{record.levelname}] {record.getMessage()}"
         try:
             self.queue.put_nowait(line)
+        except Full:
+            self.dropped += 1
         except Exception:
             pass
 
-def attach_gui_logger(queue: Queue) -> None:
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue the raw LogRecord. The listener lives in this process, so the
+    record does not need to be pre-formatted on the producing thread.
     """
-    Attach GuiLogHandler to your main app logger (ai_agent) and root.
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+def attach_gui_logger(queue: Queue) -> logging.handlers.QueueListener:
+    """
+    Attach a QueueHandler to your main app logger (ai_agent) and root.
+    Records are formatted into `queue` by a GuiLogHandler on a background
+    QueueListener thread; the caller must stop() the returned listener.
     This does NOT remove existing handlers (console/file remain intact).
     """
+    record_queue: Queue = Queue()
+
     gui_handler = GuiLogHandler(queue)
     gui_handler.setLevel(logging.INFO)
-    gui_handler.setFormatter(logging.Formatter("%(message)s"))
+    gui_handler.setFormatter(
+        logging.Formatter(
+            "[%(asctime)s] [%(levelname)s] %(message)s",
+            datefmt="%H:%M:%S",
+        )
+    )
+
+    queue_handler = _RecordQueueHandler(record_queue)
+    queue_handler.setLevel(logging.INFO)
 
     core_logger = logging.getLogger("ai_agent")
-    core_logger.addHandler(gui_handler)
+    core_logger.addHandler(queue_handler)
 
-    logging.getLogger().addHandler(gui_handler)
+    logging.getLogger().addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(record_queue, gui_handler)
+    listener.start()
+    return listener
     
 def make_tts_friendly(text: str, max_len: int = 450) -> str:
     """
@@ -98,14 +205,49 @@ def make_tts_friendly(text: str, max_len: int = 450) -> str:
     - Strip markdown code fences ```...```
     - Keep a short natural-language summary.
     """
+    from src.agent import _shorten_text, _sanitize_for_speech
+
     if not text:
         return ""
-    cleaned = re.sub(r"```.*?```", " I've put the full code in your chat window. ", text, flags=re.DOTALL)
-    cleaned = re.sub(r"(^|\n)( {4,}.*)", r"\1", cleaned)
+    cleaned = _CODE_FENCE_RE.sub(" I've put the full code in your chat window. ", text)
+    cleaned = _INDENT_RE.sub(r"\1", cleaned)
     cleaned = _sanitize_for_speech(cleaned)
     cleaned = _shorten_text(cleaned, max_len=max_len)
     return cleaned.strip()
 
+def _is_shutdown_request(lower_input: str) -> bool:
+    """One precompiled regex search; no per-utterance split or set work."""
+    return _SHUTDOWN_RE.search(lower_input) is not None
+
+_content_parts = operator.attrgetter("content.parts")
+
+def _first_part_text(event: Any) -> str:
+    try:
+        parts = _content_parts(event)
+    except AttributeError:
+        return ""
+    if not parts:
+        return ""
+    first = parts[0]
+    return getattr(first, "text", str(first)) or ""
+
+def _extract_final_text(result: Any) -> str:
+    """
+    Pull the reply text out of runner.run_debug()'s return value.
+    For an event list the last final response wins, so scan from the end.
+    """
+    if isinstance(result, str):
+        return result
+    if isinstance(result, (list, tuple)):
+        for event in reversed(result):
+            is_final = getattr(event, "is_final_response", None)
+            if is_final is not None and is_final():
+                text = _first_part_text(event)
+                if text:
+                    return text
+        return ""
+    return _first_part_text(result)
+
 class AgentGUI(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -119,25 +261,54 @@ class AgentGUI(ctk.CTk):
         self.grid_columnconfigure(1, weight=2)  
         self.grid_rowconfigure(2, weight=1)
 
-        self.chat_row = 0
+        self.messages: List[MessageData] = []
+        self._copy_mark_indices: List[int] = []
+        self._copy_mark_lines: List[int] = []
+        self._active_copy_buttons: Dict[int, ctk.CTkButton] = {}
+        self._copy_button_pool: List[ctk.CTkButton] = []
+        self._copy_check_scheduled = False
+        self._pending_messages: List[int] = []
+        self._flush_scheduled = False
+        self._msg_queue: deque[Tuple[str, str]] = deque()
+        self._msg_drain_scheduled = False
+        self._last_bot_msg: Tuple[str, float] = ("", 0.0)
+        self._diag_win: Optional[ctk.CTkToplevel] = None
+        self._diag_text: Optional[ctk.CTkTextbox] = None
+        self._profile_win: Optional[ctk.CTkToplevel] = None
+        self._profile_entries: Dict[str, ctk.CTkEntry] = {}
+        self._chip_states: Dict[int, Tuple[str, str]] = {}
+        self._ui_state_cache: Dict[str, Tuple[Any, ...]] = {}
+        self._ui_state_pending: Dict[str, Tuple[Any, ...]] = {}
+        self._ui_state_lock = threading.Lock()
         self.agent_running = False
         self.voice_enabled = True
         self.mic_enabled = True
 
-        self.voice: Optional[VoiceHandler] = None
-        self.runner: Optional[InMemoryRunner] = None
+        self.voice: Optional["VoiceHandler"] = None
+        self._original_speak = None
+        self._wake_event: Optional[asyncio.Event] = None
+        self.runner: Optional["InMemoryRunner"] = None
         self.loop_thread: Optional[threading.Thread] = None
         self.agent_loop: Optional[asyncio.AbstractEventLoop] = None
         self.stop_event = threading.Event()
+        self._bg_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="axylo-bg")
 
         self.in_session: bool = False
 
         self.last_response_ms: Optional[float] = None
 
-        self.log_queue: Queue[str] = Queue()
-        self.all_logs: List[str] = []
+        self.log_queue: Queue[str] = Queue(maxsize=LOG_QUEUE_MAXSIZE)
+        self.all_logs: deque[str] = deque(maxlen=MAX_LOG_LINES)
         self.current_log_filter: str = "All"
         self.current_log_search: str = ""
+        self._search_lower: str = ""
+        self._filtered_logs: deque[str] = deque(maxlen=MAX_LOG_LINES)
+        self._filtered_key: Tuple[str, str] = ("All", "")
+        self._filtered_seq = 0
+        self._log_view_start = 0
+        # Text lines per displayed entry, oldest first (entries can span lines).
+        self._view_line_counts: deque[int] = deque()
+        self._poll_interval_ms = 150
         
         self.user_profile = load_user_profile()
 
@@ -146,7 +317,9 @@ class AgentGUI(ctk.CTk):
         self.tts_chip = None
         self.metrics_chip = None
 
-        attach_gui_logger(self.log_queue)
+        self._log_listener = attach_gui_logger(self.log_queue)
+        self._gui_log_handler: GuiLogHandler = self._log_listener.handlers[0]
+        self._last_dropped = 0
 
         self._build_top_bar()
         self._build_quick_actions()
@@ -159,7 +332,8 @@ class AgentGUI(ctk.CTk):
             sender="bot",
         )
 
-        self.after(150, self._poll_log_queue)
+        self.after(self._poll_interval_ms, self._poll_log_queue)
+        self.after(UI_FLUSH_MS, self._flush_ui)
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _build_top_bar(self):
@@ -336,14 +510,92 @@ class AgentGUI(ctk.CTk):
         self._update_chips_llm(state="idle")
 
     def _build_chat_panel(self):
-        self.chat_frame = ctk.CTkScrollableFrame(
+        """
+        The transcript is a single tkinter.Text styled with tags instead of a
+        frame/label tree per message, so layout cost does not grow with history.
+        """
+        panel = ctk.CTkFrame(
             self,
             fg_color=BG_MAIN,
             border_width=0,
             corner_radius=0,
         )
-        self.chat_frame.grid(row=2, column=0, padx=(16, 8), pady=(8, 12), sticky="nsew")
-        self.chat_frame.grid_columnconfigure(0, weight=1)
+        panel.grid(row=2, column=0, padx=(16, 8), pady=(8, 12), sticky="nsew")
+        panel.grid_rowconfigure(0, weight=1)
+        panel.grid_columnconfigure(0, weight=1)
+
+        self._msg_font = tkfont.Font(root=self, family=MSG_FONT[0], size=MSG_FONT[1])
+        self._meta_font = tkfont.Font(root=self, family=META_FONT[0], size=META_FONT[1])
+        self._chat_width = 0
+
+        self.chat_text = tk.Text(
+            panel,
+            wrap="word",
+            bg=BG_MAIN,
+            fg=TEXT_PRIMARY_ON_DARK,
+            font=self._msg_font,
+            relief="flat",
+            borderwidth=0,
+            highlightthickness=0,
+            padx=8,
+            pady=8,
+            cursor="arrow",
+        )
+        self.chat_text.grid(row=0, column=0, sticky="nsew")
+
+        self.chat_scrollbar = ctk.CTkScrollbar(panel, command=self.chat_text.yview)
+        self.chat_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.chat_text.configure(yscrollcommand=self._on_chat_yview)
+
+        self.chat_text.tag_configure(
+            "name_user", foreground=ACCENT_PRIMARY, font=self._meta_font, justify="right"
+        )
+        self.chat_text.tag_configure(
+            "name_bot", foreground=ACCENT_SECONDARY, font=self._meta_font, justify="left"
+        )
+        self.chat_text.tag_configure(
+            "user_bubble",
+            background=USER_BUBBLE,
+            foreground=TEXT_PRIMARY,
+            lmargin1=200,
+            lmargin2=200,
+            rmargin=10,
+            spacing1=4,
+            spacing3=4,
+            justify="right",
+        )
+        self.chat_text.tag_configure(
+            "bot_bubble",
+            background=BOT_BUBBLE,
+            foreground=TEXT_PRIMARY_ON_DARK,
+            lmargin1=10,
+            lmargin2=10,
+            rmargin=200,
+            spacing1=4,
+            spacing3=4,
+            justify="left",
+        )
+        self.chat_text.tag_configure(
+            "meta_user", foreground=TEXT_MUTED, font=self._meta_font, justify="right"
+        )
+        self.chat_text.tag_configure(
+            "meta_bot", foreground=TEXT_MUTED, font=self._meta_font, justify="left"
+        )
+
+        self.chat_text.configure(state="disabled")
+        self.chat_text.bind("<Configure>", self._on_chat_resize)
+
+    def _on_chat_resize(self, event) -> None:
+        """
+        Keep bubbles at most BUBBLE_WRAP_PX wide by resizing the tag margins.
+        Only runs when the width actually changes, not on every redraw.
+        """
+        if event.width != self._chat_width:
+            self._chat_width = event.width
+            margin = max(10, event.width - BUBBLE_WRAP_PX)
+            self.chat_text.tag_configure("user_bubble", lmargin1=margin, lmargin2=margin)
+            self.chat_text.tag_configure("bot_bubble", rmargin=margin)
+        self._schedule_copy_button_check()
 
     def _build_log_panel(self):
         outer = ctk.CTkFrame(
@@ -425,6 +677,8 @@ class AgentGUI(ctk.CTk):
         )
         self.log_text.grid(row=2, column=0, padx=10, pady=(4, 10), sticky="nsew")
         self.log_text.configure(state="disabled")
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Prior>"):
+            self.log_text.bind(sequence, self._maybe_prepend_older_logs)
 
     def _build_bottom_controls(self):
         bottom = ctk.CTkFrame(
@@ -559,175 +813,335 @@ class AgentGUI(ctk.CTk):
 
     def display_message(self, text: str, sender: str = "bot"):
         """
-        Render a chat bubble in the scrollable chat panel.
+        Append a message to the chat store and queue it for rendering.
         sender: "user" or "bot"
         """
-        if not hasattr(self, "chat_frame") or self.chat_frame is None:
+        if not hasattr(self, "chat_text") or self.chat_text is None:
             return
 
-        row = self.chat_row
-        self.chat_row += 1
+        if sender == "bot":
+            now = time.monotonic()
+            prev_text, prev_t = self._last_bot_msg
+            if text == prev_text and now - prev_t < DUPLICATE_BOT_MSG_WINDOW_S:
+                return
+            self._last_bot_msg = (text, now)
 
-        wrapper = ctk.CTkFrame(
-            self.chat_frame,
-            fg_color="transparent",
+        msg = MessageData(
+            sender=sender,
+            text=text,
+            ts=datetime.now().strftime("%H:%M:%S"),
         )
-        wrapper.grid(row=row, column=0, sticky="ew", padx=4, pady=(4, 2))
-        wrapper.grid_columnconfigure(0, weight=1)
+        self.messages.append(msg)
+        self._pending_messages.append(len(self.messages) - 1)
 
-        inner = ctk.CTkFrame(
-            wrapper,
-            fg_color="transparent",
-        )
-        inner.grid(row=0, column=0, sticky="e" if sender == "user" else "w")
-
-        if sender == "user":
-            bg_color = USER_BUBBLE
-            text_color = TEXT_PRIMARY
-            anchor_val = "e"
-            meta_anchor = "e"
-            label_name = "You"
-        else:
-            bg_color = BOT_BUBBLE
-            text_color = TEXT_PRIMARY_ON_DARK
-            anchor_val = "w"
-            meta_anchor = "w"
-            label_name = "Axylo"
-
-        name_label = ctk.CTkLabel(
-            inner,
-            text=label_name,
-            font=META_FONT,
-            text_color=ACCENT_SECONDARY if sender == "bot" else ACCENT_PRIMARY,
-        )
-        name_label.grid(row=0, column=0, padx=10, pady=(2, 0), sticky=anchor_val)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_pending_messages)
 
-        bubble = ctk.CTkLabel(
-            inner,
-            text=text,
-            fg_color=bg_color,
-            text_color=text_color,
-            wraplength=420,
-            corner_radius=18,
-            padx=14,
-            pady=10,
-            justify="left" if sender == "bot" else "right",
-            font=MSG_FONT,
-        )
-        bubble.grid(row=1, column=0, padx=10, pady=(2, 0), sticky=anchor_val)
-        
-        inner.grid_columnconfigure(0, weight=1)
-        inner.grid_columnconfigure(1, weight=0)
+    def _flush_pending_messages(self) -> None:
+        """
+        Render every message queued since the last idle pass in one widget
+        update, then scroll to the bottom once.
+        """
+        self._flush_scheduled = False
+        pending, self._pending_messages = self._pending_messages, []
+        if not pending:
+            return
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        meta = ctk.CTkLabel(
-            inner,
-            text=timestamp,
-            font=META_FONT,
+        chat = self.chat_text
+        insert = chat.insert
+        messages = self.messages
+        chat.configure(state="normal")
+        for index in pending:
+            msg = messages[index]
+            if msg.sender == "user":
+                insert("end", "You\n", "name_user")
+                insert("end", msg.text + "\n", "user_bubble")
+                insert("end", msg.ts, "meta_user")
+            else:
+                insert("end", "Axylo\n", "name_bot")
+                insert("end", msg.text + "\n", "bot_bubble")
+                insert("end", msg.ts + "  ", "meta_bot")
+                mark = f"copy_{index}"
+                chat.mark_set(mark, "end-1c")
+                chat.mark_gravity(mark, "left")
+                self._copy_mark_indices.append(index)
+                self._copy_mark_lines.append(int(chat.index(mark).split(".")[0]))
+            insert("end", "\n\n")
+        chat.configure(state="disabled")
+        chat.update_idletasks()
+        chat.see("end")
+
+        self._schedule_copy_button_check()
+
+    def _on_chat_yview(self, first, last) -> None:
+        self.chat_scrollbar.set(first, last)
+        self._schedule_copy_button_check()
+
+    def _schedule_copy_button_check(self, event=None) -> None:
+        if not self._copy_check_scheduled:
+            self._copy_check_scheduled = True
+            self.after_idle(self._layout_copy_buttons)
+
+    def _new_copy_button(self) -> ctk.CTkButton:
+        return ctk.CTkButton(
+            self.chat_text,
+            text="Copy",
+            width=60,
+            height=22,
+            font=("Segoe UI", 9),
+            fg_color="transparent",
+            hover_color=PANEL_ELEVATED,
             text_color=TEXT_MUTED,
+            corner_radius=999,
+            border_width=0,
         )
-        meta.grid(row=2, column=0, padx=10, pady=(0, 6), sticky=meta_anchor)
-        
-        if sender == "bot":
-            copy_btn = ctk.CTkButton(
-                inner,
-                text="Copy",
-                width=60,
-                height=22,
-                font=("Segoe UI", 9),
-                fg_color="transparent",
-                hover_color=PANEL_ELEVATED,
-                text_color=TEXT_MUTED,
-                command=lambda t=text: self.copy_to_clipboard(t),
-                corner_radius=999,
-                border_width=0,
-            )
 
-            copy_btn.grid(
-                row=2,
-                column=1,
-                padx=(0, 10),
-                pady=(0, 6),
-                sticky="e",
-            )
-
-        self.chat_frame.update_idletasks()
+    def _layout_copy_buttons(self) -> None:
+        """
+        Place Copy buttons over the bot messages currently in view.
+        Buttons that scroll out are hidden and reused instead of destroyed,
+        so the number of live buttons tracks the viewport, not the transcript.
+        """
+        self._copy_check_scheduled = False
+        chat = self.chat_text
         try:
-            self.chat_frame._parent_canvas.yview_moveto(1.0)
+            top = int(chat.index("@0,0").split(".")[0])
+            bottom = int(chat.index(f"@0,{chat.winfo_height()}").split(".")[0])
         except Exception:
-            pass
+            return
+
+        lo = bisect_left(self._copy_mark_lines, top)
+        hi = bisect_right(self._copy_mark_lines, bottom)
+        visible = {}
+        for index in self._copy_mark_indices[lo:hi]:
+            bbox = chat.bbox(f"copy_{index}")
+            if bbox is not None:
+                visible[index] = bbox
+
+        for index in [i for i in self._active_copy_buttons if i not in visible]:
+            btn = self._active_copy_buttons.pop(index)
+            btn.place_forget()
+            self._copy_button_pool.append(btn)
+
+        scaling = ctk.ScalingTracker.get_widget_scaling(chat)
+        for index, (x, y, _w, _h) in visible.items():
+            btn = self._active_copy_buttons.get(index)
+            if btn is None:
+                btn = self._copy_button_pool.pop() if self._copy_button_pool else self._new_copy_button()
+                text = self.messages[index].text
+                btn.configure(command=partial(self.copy_to_clipboard, text))
+                self._active_copy_buttons[index] = btn
+            btn.place(x=x / scaling, y=y / scaling)
 
     def copy_to_clipboard(self, text: str) -> None:
         """
         Copy the given text to the system clipboard.
+        Deferred to idle time so the click handler returns before the clipboard IPC.
         """
+        self.after_idle(self._set_clipboard, text)
+
+    def _set_clipboard(self, text: str) -> None:
         try:
             self.clipboard_clear()
             self.clipboard_append(text)
         except Exception:
             pass
 
+    def _drain_log_queue(self) -> List[str]:
+        """
+        Take everything currently queued under one acquisition of the queue lock
+        instead of one get_nowait() round-trip per line.
+        """
+        q = self.log_queue
+        with q.mutex:
+            batch = list(q.queue)
+            if batch:
+                q.queue.clear()
+                q.unfinished_tasks -= len(batch)
+                q.not_full.notify_all()
+        return batch
+
     def _poll_log_queue(self):
-        new_lines = False
-        try:
-            while True:
-                line = self.log_queue.get_nowait()
-                self.all_logs.append(line)
-                new_lines = True
-        except Empty:
-            pass
+        new_lines = self._drain_log_queue()
+
+        dropped = self._gui_log_handler.dropped
+        if dropped > self._last_dropped:
+            new_lines.append(f"... dropped {dropped - self._last_dropped} log lines ...")
+            self._last_dropped = dropped
 
         if new_lines:
-            self._refresh_log_view()
+            self.all_logs.extend(new_lines)
+            if self._filtered_key == ("All", ""):
+                matched = new_lines
+            else:
+                match = self._line_matches_filters
+                matched = [line for line in new_lines if match(line)]
+            if matched:
+                self._filtered_logs.extend(matched)
+                self._filtered_seq += len(matched)
+                self._append_log_lines(matched)
 
-        self.after(150, self._poll_log_queue)
+        if not new_lines:
+            self._poll_interval_ms = min(LOG_POLL_MAX_MS, int(self._poll_interval_ms * 1.5))
+        elif len(new_lines) > LOG_POLL_BURST_LINES:
+            self._poll_interval_ms = max(LOG_POLL_MIN_MS, self._poll_interval_ms // 2)
 
-    def _line_matches_filters(self, line: str) -> bool:
-        mode = self.current_log_filter
+        self.after(self._poll_interval_ms, self._poll_log_queue)
 
-        if mode == "User" and "[USER]" not in line:
-            return False
-        if mode == "Agent" and "[AGENT]" not in line:
-            return False
-        if mode == "Voice" and "[VOICE]" not in line:
-            return False
-        if mode == "Tools" and "[TOOLS]" not in line:
-            return False
-        if mode == "Search" and "[SEARCH]" not in line:
+    def _append_log_lines(self, lines: List[str]) -> None:
+        """
+        Append newly matched lines with one insert per poll instead of a full rebuild.
+        The textbox is trimmed to MAX_LOG_LINES entries to match the bounded
+        history, and _log_view_start moves past the trimmed entries so a later
+        prepend continues from the first entry still shown.
+        """
+        counts = self._view_line_counts
+        counts.extend(line.count("\n") + 1 for line in lines)
+
+        self.log_text.configure(state="normal")
+        self.log_text.insert("end", "\n".join(lines) + "\n")
+        excess = len(counts) - MAX_LOG_LINES
+        if excess > 0:
+            trimmed_lines = sum(counts.popleft() for _ in range(excess))
+            self.log_text.delete("1.0", f"{trimmed_lines + 1}.0")
+            self._log_view_start += excess
+        self.log_text.see("end")
+        self.log_text.configure(state="disabled")
+
+    def _line_matches_filters(self, line: str) -> bool:
+        token = LOG_FILTER_TOKENS.get(self.current_log_filter)
+        if token is not None and token not in line:
             return False
-        if mode == "Error" and ("[ERROR]" not in line and "ERROR" not in line):
+
+        if self._search_lower and self._search_lower not in line.lower():
             return False
 
-        if self.current_log_search:
-            if self.current_log_search.lower() not in line.lower():
-                return False
+        return True
 
+    def _rebuild_filtered_logs(self) -> bool:
+        """
+        Re-scan all_logs into _filtered_logs when the filter or search changed.
+        New lines are matched incrementally in _poll_log_queue, so this full
+        scan only happens on user input. Returns True if a rebuild happened.
+        """
+        key = (self.current_log_filter, self._search_lower)
+        if key == self._filtered_key:
+            return False
+        self._filtered_key = key
+
+        match = self._line_matches_filters
+        self._filtered_logs = deque(
+            (line for line in self.all_logs if match(line)), maxlen=MAX_LOG_LINES
+        )
+        self._filtered_seq = len(self._filtered_logs)
         return True
 
     def _refresh_log_view(self):
+        """
+        Render the newest LOG_VIEW_WINDOW filtered lines only.
+        Older lines are prepended when the user scrolls to the top.
+        """
+        logs = self._filtered_logs
+        lines = list(islice(logs, max(0, len(logs) - LOG_VIEW_WINDOW), None))
+        self._log_view_start = self._filtered_seq - len(lines)
+        self._view_line_counts = deque(line.count("\n") + 1 for line in lines)
+
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
-        for line in self.all_logs:
-            if self._line_matches_filters(line):
-                self.log_text.insert("end", line + "\n")
+        if lines:
+            self.log_text.insert("end", "\n".join(lines) + "\n")
         self.log_text.see("end")
         self.log_text.configure(state="disabled")
 
+    def _maybe_prepend_older_logs(self, event=None):
+        self.after_idle(self._prepend_older_logs)
+
+    def _prepend_older_logs(self) -> None:
+        if self.log_text.yview()[0] > 0.0:
+            return
+
+        logs = self._filtered_logs
+        first_seq = self._filtered_seq - len(logs)
+        stop = self._log_view_start - first_seq
+        if stop <= 0:
+            return
+
+        counts = self._view_line_counts
+        room = MAX_LOG_LINES - len(counts)
+        start = max(0, stop - min(LOG_VIEW_WINDOW, room))
+        if start >= stop:
+            return
+        lines = list(islice(logs, start, stop))
+        self._log_view_start = first_seq + start
+        added = [line.count("\n") + 1 for line in lines]
+        counts.extendleft(reversed(added))
+
+        self.log_text.configure(state="normal")
+        self.log_text.insert("1.0", "\n".join(lines) + "\n")
+        self.log_text.configure(state="disabled")
+        self.log_text.see(f"{sum(added) + 1}.0")
+
     def _on_log_filter_change(self, choice: str):
         self.current_log_filter = choice or "All"
-        self._refresh_log_view()
+        if self._rebuild_filtered_logs():
+            self._refresh_log_view()
 
     def _on_log_search_change(self, event):
         self.current_log_search = self.log_search_entry.get().strip()
-        self._refresh_log_view()
+        self._search_lower = self.current_log_search.lower()
+        if self._rebuild_filtered_logs():
+            self._refresh_log_view()
+
+    def _queue_ui(self, key: str, state: Tuple[Any, ...]) -> None:
+        """
+        Record the latest UI state for `key` from the agent thread.
+        _flush_ui applies it on the Tk thread; intermediate values are dropped.
+        """
+        with self._ui_state_lock:
+            self._ui_state_pending[key] = state
+
+    def _flush_ui(self):
+        with self._ui_state_lock:
+            pending, self._ui_state_pending = self._ui_state_pending, {}
+
+        cache = self._ui_state_cache
+        for key, state in pending.items():
+            if key == "status":
+                if cache.get(key) is not state:
+                    self._set_status(*state)
+                    cache[key] = state
+            elif key == "llm":
+                self._update_chips_llm(*state)
+            elif key == "mic":
+                self._update_chips_mic()
+            elif key == "tts":
+                self._update_chips_tts(*state)
+
+        self.after(UI_FLUSH_MS, self._flush_ui)
 
     def _set_status(self, text: str, color: str = "#FACC15"):
+        state = (text, color)
+        if self._ui_state_cache.get("status") == state:
+            return
+        self._ui_state_cache["status"] = state
         try:
             self.status_label.configure(text=text)
             self.status_dot.configure(text_color=color)
         except Exception:
             pass
 
+    def _configure_chip(self, chip: ctk.CTkLabel, text: str, color: str) -> None:
+        """
+        Reconfigure a status chip only if its text or color actually changed;
+        every CTk configure() triggers a canvas redraw.
+        """
+        state = (text, color)
+        if self._chip_states.get(id(chip)) == state:
+            return
+        self._chip_states[id(chip)] = state
+        chip.configure(text=text, text_color=color)
+
     def _update_chips_llm(self, state: str):
         """
         state: "idle" or "thinking"
@@ -736,36 +1150,37 @@ class AgentGUI(ctk.CTk):
             return
 
         if state == "thinking":
-            self.llm_chip.configure(text="LLM: Thinking", text_color=ACCENT_PRIMARY)
+            self._configure_chip(self.llm_chip, "LLM: Thinking", ACCENT_PRIMARY)
         else:
-            self.llm_chip.configure(text="LLM: Ready", text_color=TEXT_MUTED)
+            self._configure_chip(self.llm_chip, "LLM: Ready", TEXT_MUTED)
 
         if self.last_response_ms is not None:
-            self.metrics_chip.configure(
-                text=f"Last LLM: {int(self.last_response_ms)} ms",
-                text_color=TEXT_MUTED,
+            self._configure_chip(
+                self.metrics_chip,
+                f"Last LLM: {int(self.last_response_ms)} ms",
+                TEXT_MUTED,
             )
         else:
-            self.metrics_chip.configure(text="Last LLM: –", text_color=TEXT_MUTED)
+            self._configure_chip(self.metrics_chip, "Last LLM: –", TEXT_MUTED)
 
     def _update_chips_mic(self):
         if not self.mic_chip:
             return
         if self.mic_enabled:
-            self.mic_chip.configure(text="Mic: Continuous", text_color=ACCENT_SECONDARY)
+            self._configure_chip(self.mic_chip, "Mic: Continuous", ACCENT_SECONDARY)
         else:
-            self.mic_chip.configure(text="Mic: Muted", text_color=TEXT_MUTED)
+            self._configure_chip(self.mic_chip, "Mic: Muted", TEXT_MUTED)
 
     def _update_chips_tts(self, error: bool = False):
         if not self.tts_chip:
             return
         if not self.voice_enabled:
-            self.tts_chip.configure(text="TTS: Muted", text_color=TEXT_MUTED)
+            self._configure_chip(self.tts_chip, "TTS: Muted", TEXT_MUTED)
         else:
             if error:
-                self.tts_chip.configure(text="TTS: Error", text_color=ACCENT_PRIMARY)
+                self._configure_chip(self.tts_chip, "TTS: Error", ACCENT_PRIMARY)
             else:
-                self.tts_chip.configure(text="TTS: ON", text_color=ACCENT_SECONDARY)
+                self._configure_chip(self.tts_chip, "TTS: ON", ACCENT_SECONDARY)
 
     def start_agent(self):
         """
@@ -777,6 +1192,8 @@ class AgentGUI(ctk.CTk):
             return
 
         self.stop_event.clear()
+        with self._ui_state_lock:
+            self._ui_state_pending.clear()
         self.agent_running = True
         self.last_response_ms = None
         self._set_status("Starting agent…", color="#FACC15")
@@ -803,6 +1220,7 @@ class AgentGUI(ctk.CTk):
 
         self._set_status("Stopping agent…", color="#F97316")
         self.stop_event.set()
+        self._wake_agent()
         self.stop_btn.configure(state="disabled")
         self.restart_btn.configure(state="disabled")
 
@@ -834,10 +1252,10 @@ class AgentGUI(ctk.CTk):
             return
 
         self.stop_event.set()
+        self._wake_agent()
         self.stop_btn.configure(state="disabled")
         self.restart_btn.configure(state="disabled")
-        t = threading.Thread(target=self._restart_worker, daemon=True)
-        t.start()
+        self._bg_pool.submit(self._restart_worker)
 
     def toggle_voice(self):
         """
@@ -850,7 +1268,24 @@ class AgentGUI(ctk.CTk):
         else:
             self.voice_btn.configure(text="Voice: OFF", text_color=TEXT_MUTED)
             self._set_status("Voice output muted.", color="#FACC15")
+            self._stop_current_speech()
         self._update_chips_tts(error=False)
+        self._wake_agent()
+
+    def _stop_current_speech(self) -> None:
+        """
+        Cut off whatever is playing, including the remaining sentences of a
+        speak_streamed() reply, which does not go through _speak_wrapped.
+        Runs on the agent loop, where the stop generation counter is read.
+        """
+        loop = self.agent_loop
+        voice = self.voice
+        if loop is None or voice is None:
+            return
+        try:
+            loop.call_soon_threadsafe(voice.stop_speaking)
+        except RuntimeError:
+            pass
 
     def toggle_mic(self):
         """
@@ -865,90 +1300,73 @@ class AgentGUI(ctk.CTk):
             self.mic_btn.configure(text="Mic: OFF", text_color=TEXT_MUTED)
             self._set_status("Online • Mic muted", color="#FACC15")
         self._update_chips_mic()
+        self._wake_agent()
 
     def open_chat_window(self):
         """
         Launch the separate chatbot UI window (chatbot_ui.py).
+        The process spawn runs off the Tk thread so the UI never stalls on it.
         """
-        try:
-            script_path = os.path.join(project_root, "src", "chatbot_ui.py")
-            if not os.path.exists(script_path):
-                self.display_message(
-                    "Chat window script not found at src/chatbot_ui.py.",
-                    sender="bot",
-                )
-                return
-            subprocess.Popen([sys.executable, script_path])
-            self.display_message("Opened chat window.", sender="bot")
-        except Exception as e:
-            logger.error(f"Failed to open chat window: {e}")
-            self.display_message("Failed to open chat window.", sender="bot")
-            
+        if not CHATBOT_UI_EXISTS:
+            self.display_message(
+                "Chat window script not found at src/chatbot_ui.py.",
+                sender="bot",
+            )
+            return
+
+        def worker():
+            try:
+                subprocess.Popen([sys.executable, CHATBOT_UI_SCRIPT], close_fds=True)
+                self._enqueue_message("Opened chat window.", "bot")
+            except Exception as e:
+                logger.error(f"Failed to open chat window: {e}")
+                self._enqueue_message("Failed to open chat window.", "bot")
+
+        self._bg_pool.submit(worker)
+
     def open_profile_dialog(self):
         """
         Small window to edit persistent user info (name, age, etc.).
         Data is saved to user_profile.json and used by the agent for personalization.
+        The window is built once and hidden on close; reopening only refills the entries.
         """
+        win = self._profile_win
+        if win is None or not win.winfo_exists():
+            win = self._build_profile_window()
+        else:
+            win.deiconify()
+            win.lift()
+        win.grab_set()
+
+        profile = self.user_profile or {}
+        for key, entry in self._profile_entries.items():
+            value = profile.get(key)
+            entry.delete(0, "end")
+            entry.insert(0, str(value) if value is not None else "")
+
+    def _build_profile_window(self) -> ctk.CTkToplevel:
         win = ctk.CTkToplevel(self)
         win.title("Your profile")
         win.geometry("360x260")
         win.resizable(False, False)
         win.transient(self)
-        win.grab_set()
-
-        profile = self.user_profile or {}
+        win.protocol("WM_DELETE_WINDOW", self._hide_profile_window)
+        win.grid_propagate(False)
 
         win.grid_columnconfigure(1, weight=1)
 
-        ctk.CTkLabel(win, text="Name:").grid(row=0, column=0, padx=12, pady=(12, 4), sticky="e")
-        name_entry = ctk.CTkEntry(win, width=220)
-        name_entry.grid(row=0, column=1, padx=12, pady=(12, 4), sticky="ew")
-        name_entry.insert(0, (profile.get("name") or ""))
-
-        ctk.CTkLabel(win, text="Age:").grid(row=1, column=0, padx=12, pady=4, sticky="e")
-        age_entry = ctk.CTkEntry(win, width=220)
-        age_entry.grid(row=1, column=1, padx=12, pady=4, sticky="ew")
-        age_val = profile.get("age")
-        age_entry.insert(0, str(age_val) if age_val is not None else "")
-
-        ctk.CTkLabel(win, text="Role:").grid(row=2, column=0, padx=12, pady=4, sticky="e")
-        role_entry = ctk.CTkEntry(win, width=220)
-        role_entry.grid(row=2, column=1, padx=12, pady=4, sticky="ew")
-        role_entry.insert(0, (profile.get("role") or ""))
-
-        ctk.CTkLabel(win, text="Location:").grid(row=3, column=0, padx=12, pady=4, sticky="e")
-        loc_entry = ctk.CTkEntry(win, width=220)
-        loc_entry.grid(row=3, column=1, padx=12, pady=4, sticky="ew")
-        loc_entry.insert(0, (profile.get("location") or ""))
-
-        ctk.CTkLabel(win, text="Notes:").grid(row=4, column=0, padx=12, pady=4, sticky="e")
-        notes_entry = ctk.CTkEntry(win, width=220)
-        notes_entry.grid(row=4, column=1, padx=12, pady=4, sticky="ew")
-        notes_entry.insert(0, (profile.get("notes") or ""))
-
-        def on_save():
-            new_profile = {
-                "name": name_entry.get().strip() or None,
-                "age": age_entry.get().strip() or None,
-                "role": role_entry.get().strip() or None,
-                "location": loc_entry.get().strip() or None,
-                "notes": notes_entry.get().strip() or None,
-            }
-            save_user_profile(new_profile)
-            self.user_profile = new_profile
-            win.destroy()
-            self.display_message(
-                "Got it. I'll remember this profile for future conversations.",
-                sender="bot",
-            )
-
-        def on_cancel():
-            win.destroy()
+        self._profile_entries = {}
+        for row, (key, label) in enumerate(_PROFILE_FIELDS):
+            pady = (12, 4) if row == 0 else 4
+            ctk.CTkLabel(win, text=label).grid(row=row, column=0, padx=12, pady=pady, sticky="e")
+            entry = ctk.CTkEntry(win, width=220)
+            entry.grid(row=row, column=1, padx=12, pady=pady, sticky="ew")
+            self._profile_entries[key] = entry
 
         btn_frame = ctk.CTkFrame(win, fg_color="transparent")
-        btn_frame.grid(row=5, column=0, columnspan=2, pady=(12, 10))
+        btn_frame.grid(row=len(_PROFILE_FIELDS), column=0, columnspan=2, pady=(12, 10))
 
-        save_btn = ctk.CTkButton(btn_frame, text="Save", width=80, command=on_save)
+        save_btn = ctk.CTkButton(btn_frame, text="Save", width=80, command=self._save_profile)
         save_btn.grid(row=0, column=0, padx=8)
 
         cancel_btn = ctk.CTkButton(
@@ -957,9 +1375,30 @@ class AgentGUI(ctk.CTk):
             width=80,
             fg_color=PANEL_MAIN,
             hover_color="#374151",
-            command=on_cancel,
+            command=self._hide_profile_window,
         )
         cancel_btn.grid(row=0, column=1, padx=8)
+
+        self._profile_win = win
+        return win
+
+    def _save_profile(self):
+        new_profile = {
+            key: entry.get().strip() or None
+            for key, entry in self._profile_entries.items()
+        }
+        save_user_profile(new_profile)
+        self.user_profile = new_profile
+        self._hide_profile_window()
+        self.display_message(
+            "Got it. I'll remember this profile for future conversations.",
+            sender="bot",
+        )
+
+    def _hide_profile_window(self):
+        if self._profile_win is not None:
+            self._profile_win.grab_release()
+            self._profile_win.withdraw()
         
     def stop_tts_now(self):
         """
@@ -997,21 +1436,13 @@ class AgentGUI(ctk.CTk):
             except Exception as e:
                 summary_text = f"Diagnostics failed with an unexpected error:\n{e}"
             else:
-                lines = []
-                status_counts = {"ok": 0, "warning": 0, "error": 0, "info": 0}
-
-                for res in results:
-                    status_counts[res.status] = status_counts.get(res.status, 0) + 1
-                    icon = {
-                        "ok": "✅",
-                        "warning": "⚠️",
-                        "error": "❌",
-                        "info": "ℹ️",
-                    }.get(res.status, "•")
-                    line = f"{icon} {res.id}: {res.message}"
+                status_counts = Counter(res.status for res in results)
+                lines: List[str] = [""] * len(results)
+                for i, res in enumerate(results):
+                    line = f"{_DIAG_ICONS.get(res.status, '•')} {res.id}: {res.message}"
                     if res.details:
                         line += f"\n    Details: {res.details}"
-                    lines.append(line)
+                    lines[i] = line
 
                 header = (
                     f"Diagnostics complete.\n"
@@ -1037,20 +1468,35 @@ class AgentGUI(ctk.CTk):
 
             self.after(0, on_done)
 
-        t = threading.Thread(target=worker, daemon=True)
-        t.start()
+        self._bg_pool.submit(worker)
         
     def _show_diagnostics_window(self, summary_text: str):
         """
         Show diagnostics results in a popup window with a scrollable text box
-        and a Close button.
+        and a Close button. The window is reused across runs and hidden on close.
         """
+        win = self._diag_win
+        if win is None or not win.winfo_exists():
+            win = self._build_diagnostics_window()
+        else:
+            win.deiconify()
+            win.lift()
+        win.grab_set()
+
+        summary_text = summary_text or "No diagnostics output."
+        text_box = self._diag_text
+        text_box.configure(state="normal")
+        text_box.delete("1.0", "end")
+        text_box.insert("1.0", summary_text)
+        text_box.configure(state="disabled")
+
+    def _build_diagnostics_window(self) -> ctk.CTkToplevel:
         win = ctk.CTkToplevel(self)
         win.title("Diagnostics results")
         win.geometry("700x500")
         win.minsize(520, 360)
         win.transient(self)
-        win.grab_set()
+        win.protocol("WM_DELETE_WINDOW", self._hide_diagnostics_window)
 
         win.grid_columnconfigure(0, weight=1)
         win.grid_rowconfigure(0, weight=0)
@@ -1074,10 +1520,6 @@ class AgentGUI(ctk.CTk):
         )
         text_box.grid(row=1, column=0, padx=16, pady=(4, 8), sticky="nsew")
 
-        summary_text = summary_text or "No diagnostics output."
-        text_box.insert("1.0", summary_text)
-        text_box.configure(state="disabled")
-
         btn_frame = ctk.CTkFrame(win, fg_color="transparent")
         btn_frame.grid(row=2, column=0, pady=(0, 12))
 
@@ -1090,10 +1532,19 @@ class AgentGUI(ctk.CTk):
             fg_color=PANEL_MAIN,
             hover_color="#374151",
             text_color=TEXT_MUTED,
-            command=win.destroy,
+            command=self._hide_diagnostics_window,
         )
         close_btn.grid(row=0, column=0, padx=8, pady=4)
 
+        self._diag_win = win
+        self._diag_text = text_box
+        return win
+
+    def _hide_diagnostics_window(self):
+        if self._diag_win is not None:
+            self._diag_win.grab_release()
+            self._diag_win.withdraw()
+
     def _dispatch_text_to_agent(self, text: str):
         """
         Send a text command into the running agent as if it was spoken.
@@ -1117,9 +1568,8 @@ class AgentGUI(ctk.CTk):
         self.display_message(cleaned, sender="user")
 
         try:
-            asyncio.run_coroutine_threadsafe(
-                self._handle_with_request_id(cleaned, self.voice, self.runner),
-                self.agent_loop,
+            self.call_on_agent(
+                self._handle_with_request_id(cleaned, self.voice, self.runner)
             )
         except Exception as e:
             logging.getLogger("ai_agent").exception(
@@ -1141,6 +1591,30 @@ class AgentGUI(ctk.CTk):
     def _quick_voice_messaging(self):
         self._dispatch_text_to_agent("send a message")
 
+    def call_on_agent(self, coro):
+        """
+        Submit a coroutine to the agent's asyncio loop from the Tk thread.
+        Returns the concurrent.futures.Future for the result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.agent_loop)
+
+    def _enqueue_message(self, text: str, sender: str = "bot") -> None:
+        """
+        Queue a chat message from any thread. Messages posted before the Tk
+        thread gets to them are drained together in one callback.
+        """
+        self._msg_queue.append((text, sender))
+        if not self._msg_drain_scheduled:
+            self._msg_drain_scheduled = True
+            self.after(0, self._drain_messages)
+
+    def _drain_messages(self) -> None:
+        self._msg_drain_scheduled = False
+        queue = self._msg_queue
+        while queue:
+            text, sender = queue.popleft()
+            self.display_message(text, sender=sender)
+
     def _run_async_agent_loop_thread(self):
         """
         Runs an asyncio event loop in a dedicated thread
@@ -1154,16 +1628,25 @@ class AgentGUI(ctk.CTk):
         except Exception:
             logging.getLogger("ai_agent").exception("Agent loop crashed")
         finally:
+            # The cached model's connections belong to this loop; release them
+            # here so a Start/Restart on a new loop builds a fresh model.
+            try:
+                if self.agent_loop is not None:
+                    from src.agent import close_axylo_agent
+
+                    self.agent_loop.run_until_complete(close_axylo_agent())
+            except Exception:
+                logging.getLogger("ai_agent").exception("Agent cleanup failed")
             try:
                 if self.agent_loop is not None:
                     self.agent_loop.close()
             except Exception:
                 pass
             self.agent_loop = None
+            self._queue_ui("status", STATUS_STOPPED)
             self.after(
                 0,
                 lambda: (
-                    self._set_status("Idle • Agent stopped", color="#FACC15"),
                     self.start_btn.configure(state="normal"),
                     self.stop_btn.configure(state="disabled"),
                     self.restart_btn.configure(state="disabled"),
@@ -1172,42 +1655,71 @@ class AgentGUI(ctk.CTk):
             self.agent_running = False
 
     async def _handle_with_request_id(
-        self, cleaned_input: str, voice: VoiceHandler, runner: InMemoryRunner
+        self, cleaned_input: str, voice: "VoiceHandler", runner: "InMemoryRunner"
     ) -> bool:
         """
         Wraps _process_user_input with per-request request_id handling.
         Returns True if the loop should stop.
         """
-        import uuid
-
-        request_id = uuid.uuid4().hex[:8]
+        request_id = format(next(_REQ_COUNTER) & 0xFFFFFFFF, "08x")
         logger.set_request_id(request_id)
         try:
             return await self._process_user_input(cleaned_input, voice, runner)
         finally:
             logger.set_request_id(None)
 
+    async def _wait_for_wake(self, timeout: float = 1.0) -> None:
+        """
+        Park the paused agent loop until _wake_agent() is called (mic toggle,
+        session end, stop) instead of polling every 200 ms.
+        """
+        self._wake_event.clear()
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _wake_agent(self) -> None:
+        """Wake a paused agent loop from the Tk thread."""
+        loop = self.agent_loop
+        event = self._wake_event
+        if loop is None or event is None:
+            return
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            pass
+
+    async def _speak_wrapped(self, text: str, *args, **kwargs):
+        """
+        Installed as voice.speak: honours the voice toggle and reports TTS
+        health to the status chip.
+        """
+        if not self.voice_enabled:
+            return
+        try:
+            await self._original_speak(text, *args, **kwargs)
+            self._queue_ui("tts", TTS_OK)
+        except Exception as e:
+            logger.error(f"TTS speak failed: {e}")
+            self._queue_ui("tts", TTS_ERROR)
+
     async def _agent_loop(self):
         """
         Core voice agent loop.
         This is adapted from main.py:run_agent_loop, but wired to GUI.
         """
+        # Heavy imports are deferred to the agent thread so the window paints first.
+        from google.adk.runners import InMemoryRunner
+        from src.agent import create_axylo_agent
+        from src.voice_io import VoiceHandler
+
         voice = VoiceHandler(tts_voice=os.getenv("TTS_VOICE", "en-GB-RyanNeural"))
         self.voice = voice
 
-        original_speak = voice.speak
-
-        async def speak_wrapper(text: str, *args, **kwargs):
-            if not self.voice_enabled:
-                return
-            try:
-                await original_speak(text, *args, **kwargs)
-                self.after(0, lambda: self._update_chips_tts(error=False))
-            except Exception as e:
-                logger.error(f"TTS speak failed: {e}")
-                self.after(0, lambda: self._update_chips_tts(error=True))
-
-        voice.speak = speak_wrapper 
+        if voice.speak != self._speak_wrapped:
+            self._original_speak = voice.speak
+            voice.speak = self._speak_wrapped
 
         try:
             loop = asyncio.get_running_loop()
@@ -1220,6 +1732,9 @@ class AgentGUI(ctk.CTk):
         runner.render_fn = lambda *args, **kwargs: None
         runner.debug = False
 
+        # Created before the runner is published: quick actions dispatched
+        # during the intro can already end a session and wake the loop.
+        self._wake_event = asyncio.Event()
         self.runner = runner
 
         name = (self.user_profile or {}).get("name") if hasattr(self, "user_profile") else None
@@ -1232,14 +1747,12 @@ class AgentGUI(ctk.CTk):
             await voice.speak(intro_text)
         except Exception:
             pass
-        self.after(0, lambda: self.display_message(intro_text, sender="bot"))
-        self.after(
-            0, lambda: self._set_status("Online • Listening…", color="#22C55E")
-        )
+        self._enqueue_message(intro_text, "bot")
+        self._queue_ui("status", STATUS_ONLINE)
 
-        self.after(0, self._update_chips_mic)
-        self.after(0, lambda: self._update_chips_llm(state="idle"))
-        self.after(0, lambda: self._update_chips_tts(error=False))
+        self._queue_ui("mic", ())
+        self._queue_ui("llm", LLM_IDLE)
+        self._queue_ui("tts", TTS_OK)
 
         consecutive_empty = 0
         MAX_EMPTY_BEFORE_SLEEP = 20
@@ -1247,26 +1760,16 @@ class AgentGUI(ctk.CTk):
         try:
             while not self.stop_event.is_set():
                 if self.in_session:
-                    await asyncio.sleep(0.2)
+                    await self._wait_for_wake()
                     continue
 
                 if not self.mic_enabled:
-                    self.after(
-                        0,
-                        lambda: self._set_status(
-                            "Online • Mic muted", color="#FACC15"
-                        ),
-                    )
-                    await asyncio.sleep(0.2)
+                    self._queue_ui("status", STATUS_MIC_MUTED)
+                    await self._wait_for_wake()
                     continue
 
                 try:
-                    self.after(
-                        0,
-                        lambda: self._set_status(
-                            "Listening…", color="#60A5FA"
-                        ),
-                    )
+                    self._queue_ui("status", STATUS_LISTENING)
                     user_input = await voice.listen_async(
                         timeout=5, phrase_time_limit=10
                     )
@@ -1290,12 +1793,7 @@ class AgentGUI(ctk.CTk):
 
                 cleaned_input = user_input.strip()
                 if cleaned_input:
-                    self.after(
-                        0,
-                        lambda txt=cleaned_input: self.display_message(
-                            txt, sender="user"
-                        ),
-                    )
+                    self._enqueue_message(cleaned_input, "user")
 
                 stop_flag = await self._handle_with_request_id(
                     cleaned_input, voice, runner
@@ -1303,12 +1801,7 @@ class AgentGUI(ctk.CTk):
                 if stop_flag:
                     break
 
-                self.after(
-                    0,
-                    lambda: self._set_status(
-                        "Online • Listening…", color="#22C55E"
-                    ),
-                )
+                self._queue_ui("status", STATUS_ONLINE)
 
         except asyncio.CancelledError:
             try:
@@ -1348,180 +1841,138 @@ class AgentGUI(ctk.CTk):
             except Exception:
                 pass
 
-    async def _process_user_input(
-        self,
-        cleaned_input: str,
-        voice: VoiceHandler,
-        runner: InMemoryRunner,
+            self._wake_event = None
+
+    async def _handle_smart_write(
+        self, cleaned_input: str, lower_input: str, voice: "VoiceHandler"
     ) -> bool:
-        """
-        Main intent handling logic (shutdown, smart writer, voice typing, messaging, LLM).
-        Returns True if the agent loop should stop (shutdown phrase).
-        """
-        logger.user(cleaned_input)
-        lower_input = cleaned_input.lower()
+        """"write ..." -> smart AI writer."""
+        if not lower_input.startswith("write "):
+            return False
 
-        if (
-            "bye" in lower_input
-            or "bye bye" in lower_input
-            or "byebye" in lower_input
-            or "bye-bye" in lower_input
-            or "shut down" in lower_input
-            or "shutdown" in lower_input
-            or "shut-down" in lower_input
-        ):
-            goodbye_text = "Bye! Shutting down."
-            try:
-                await voice.speak(goodbye_text)
-            except Exception:
-                pass
-            self.after(
-                0,
-                lambda: self.display_message(
-                    goodbye_text, sender="bot"
-                ),
-            )
-            return True
+        self._enqueue_message("Starting smart AI writing…", "bot")
+        from src.smart_writer import handle_smart_ai_writing
 
-        if lower_input.startswith("write "):
-            self.after(
-                0,
-                lambda: self.display_message(
-                    "Starting smart AI writing…", sender="bot"
-                ),
-            )
-            await handle_smart_ai_writing(cleaned_input, voice)
+        await handle_smart_ai_writing(cleaned_input, voice)
+        return True
+
+    async def _handle_voice_typing(
+        self, cleaned_input: str, lower_input: str, voice: "VoiceHandler"
+    ) -> bool:
+        """"voice typing" -> dictation session in Notepad."""
+        if lower_input not in _VOICE_TYPING_PHRASES:
             return False
 
-        if lower_input in ("voice typing", "start voice typing"):
+        try:
+            await voice.speak("Starting voice typing in Notepad.")
+            self._enqueue_message("Starting voice typing in Notepad…", "bot")
+        except Exception:
+            pass
+        
+        prev_session = self.in_session
+        self.in_session = True
+        try:
+            self._queue_ui("status", STATUS_VOICE_TYPING)
+            from src.voice_typing import start_voice_typing
+
+            await start_voice_typing(voice)
+        except Exception as e:
+            logger.error(f"Voice typing session error: {e}")
             try:
-                await voice.speak("Starting voice typing in Notepad.")
-                self.after(
-                    0,
-                    lambda: self.display_message(
-                        "Starting voice typing in Notepad…",
-                        sender="bot",
-                    ),
+                await voice.speak(
+                    "Voice typing failed because of an internal error."
                 )
             except Exception:
                 pass
-            
-            prev_session = self.in_session
-            self.in_session = True
-            try:
-                self.after(
-                    0,
-                    lambda: self._set_status(
-                        "Voice typing session…", color="#60A5FA"
-                    ),
-                )
-                await start_voice_typing(voice)
-            except Exception as e:
-                logger.error(f"Voice typing session error: {e}")
-                try:
-                    await voice.speak(
-                        "Voice typing failed because of an internal error."
-                    )
-                except Exception:
-                    pass
-            finally:
-                self.in_session = prev_session
-                self.after(
-                    0,
-                    lambda: self._set_status(
-                        "Online • Listening…", color="#22C55E"
-                    ),
-                )
+        finally:
+            self.in_session = prev_session
+            self._wake_agent()
+            self._queue_ui("status", STATUS_ONLINE)
+
+        return True
 
+    async def _handle_send_message(
+        self, cleaned_input: str, lower_input: str, voice: "VoiceHandler"
+    ) -> bool:
+        """"send a message [to X]" -> guided voice messaging session."""
+        if not lower_input.startswith(_SEND_MESSAGE_PREFIXES):
             return False
 
-        if lower_input.startswith("send a message") or lower_input.startswith(
-            "send message"
-        ):
-            initial_recipient = None
-            if " to " in lower_input:
-                try:
-                    initial_recipient = lower_input.split(" to ", 1)[1].strip()
-                except Exception:
-                    initial_recipient = None
+        _, sep, rest = lower_input.partition(" to ")
+        initial_recipient = rest.strip() if sep else None
+        try:
+            await voice.speak("Okay, I will help you send a message.")
+            self._enqueue_message("Okay, I will help you send a message.", "bot")
+        except Exception:
+            pass
+        prev_session = self.in_session
+        self.in_session = True
+        try:
+            self._queue_ui("status", STATUS_VOICE_MESSAGING)
+            from src.voice_messaging import start_voice_messaging
+
+            await start_voice_messaging(
+                voice, initial_recipient=initial_recipient
+            )
+        except Exception as e:
+            logger.error(f"Voice messaging session error: {e}")
             try:
-                await voice.speak("Okay, I will help you send a message.")
-                self.after(
-                    0,
-                    lambda: self.display_message(
-                        "Okay, I will help you send a message.",
-                        sender="bot",
-                    ),
+                await voice.speak(
+                    "Message sending failed because of an internal error."
                 )
             except Exception:
                 pass
-            prev_session = self.in_session
-            self.in_session = True
+        finally:
+            self.in_session = prev_session
+            self._wake_agent()
+            self._queue_ui("status", STATUS_ONLINE)
+
+        return True
+
+    # Keyed by the first word of the utterance; each handler returns False
+    # if the rest of the phrase does not match so the LLM gets it instead.
+    _INTENT_DISPATCH = {
+        "write": _handle_smart_write,
+        "voice": _handle_voice_typing,
+        "start": _handle_voice_typing,
+        "send": _handle_send_message,
+    }
+
+    async def _process_user_input(
+        self,
+        cleaned_input: str,
+        voice: "VoiceHandler",
+        runner: "InMemoryRunner",
+    ) -> bool:
+        """
+        Main intent handling logic (shutdown, smart writer, voice typing, messaging, LLM).
+        Returns True if the agent loop should stop (shutdown phrase).
+        """
+        logger.user(cleaned_input)
+        lower_input = cleaned_input.lower()
+
+        if _is_shutdown_request(lower_input):
+            goodbye_text = "Bye! Shutting down."
             try:
-                self.after(
-                    0,
-                    lambda: self._set_status(
-                        "Voice messaging session…", color="#60A5FA"
-                    ),
-                )
-                await start_voice_messaging(
-                    voice, initial_recipient=initial_recipient
-                )
-            except Exception as e:
-                logger.error(f"Voice messaging session error: {e}")
-                try:
-                    await voice.speak(
-                        "Message sending failed because of an internal error."
-                    )
-                except Exception:
-                    pass
-            finally:
-                self.in_session = prev_session
-                self.after(
-                    0,
-                    lambda: self._set_status(
-                        "Online • Listening…", color="#22C55E"
-                    ),
-                )
+                await voice.speak(goodbye_text)
+            except Exception:
+                pass
+            self._enqueue_message(goodbye_text, "bot")
+            return True
 
+        handler = self._INTENT_DISPATCH.get(lower_input.split(" ", 1)[0])
+        if handler is not None and await handler(self, cleaned_input, lower_input, voice):
             return False
 
-        self.after(
-            0,
-            lambda: self._set_status("Thinking…", color="#F97316"),
-        )
-        self.after(0, lambda: self._update_chips_llm(state="thinking"))
+        self._queue_ui("status", STATUS_THINKING)
+        self._queue_ui("llm", LLM_THINKING)
 
         start_t = time.perf_counter()
         final_text = ""
 
         try:
             result = await runner.run_debug(cleaned_input)
-
-            if isinstance(result, (list, tuple)):
-                for event in result:
-                    try:
-                        if hasattr(event, "is_final_response") and event.is_final_response():
-                            content = getattr(event, "content", None)
-                            parts = getattr(content, "parts", None) if content else None
-                            if parts:
-                                first = parts[0]
-                                final_text = getattr(first, "text", str(first))
-                    except Exception:
-                        if isinstance(event, str):
-                            final_text = event
-            else:
-                try:
-                    if hasattr(result, "content"):
-                        parts = getattr(result.content, "parts", None)
-                        if parts:
-                            first = parts[0]
-                            final_text = getattr(first, "text", str(first))
-                    elif isinstance(result, str):
-                        final_text = result
-                except Exception:
-                    final_text = str(result)
-
+            final_text = _extract_final_text(result)
         except asyncio.CancelledError:
             raise
         except Exception as e:
@@ -1530,35 +1981,24 @@ class AgentGUI(ctk.CTk):
 
         end_t = time.perf_counter()
         self.last_response_ms = (end_t - start_t) * 1000.0
-        self.after(0, lambda: self._update_chips_llm(state="idle"))
+        self._queue_ui("llm", LLM_IDLE)
 
         if final_text:
             logger.agent(final_text)
-            self.after(
-                0,
-                lambda txt=final_text: self.display_message(
-                    txt, sender="bot"
-                ),
-            )
-            
-            tts_text = make_tts_friendly(final_text)
-            
+            self._enqueue_message(final_text, "bot")
+
             try:
-                await voice.speak(final_text)
-                self.after(0, lambda: self._update_chips_tts(error=False))
+                if self.voice_enabled:
+                    await voice.speak_streamed(make_tts_friendly(final_text))
+                self._queue_ui("tts", TTS_OK)
             except Exception as e:
                 logger.error(f"Voice speak failed: {e}")
-                self.after(0, lambda: self._update_chips_tts(error=True))
+                self._queue_ui("tts", TTS_ERROR)
         else:
             fallback_text = (
                 "I couldn't parse the agent's response. Please check logs."
             )
-            self.after(
-                0,
-                lambda: self.display_message(
-                    fallback_text, sender="bot"
-                ),
-            )
+            self._enqueue_message(fallback_text, "bot")
             try:
                 await voice.speak(fallback_text)
             except Exception:
@@ -1568,6 +2008,11 @@ class AgentGUI(ctk.CTk):
 
     def _on_close(self):
         self.stop_event.set()
+        self._bg_pool.shutdown(wait=False, cancel_futures=True)
+        try:
+            self._log_listener.stop()
+        except Exception:
+            pass
         self.destroy()
 
 def main():
@@ -3,9 +3,13 @@ import os
 import logging
 import signal
 import contextlib
+import html
+import inspect
 import time
-import uuid  
+from itertools import count
+from operator import attrgetter
 import re
+from typing import Any, Callable, Optional
 
 from dotenv import load_dotenv
 
@@ -15,7 +19,7 @@ import src.logger as logger
 
 from src.voice_io import VoiceHandler
 from src.agent import create_axylo_agent
-from src.agent import _shorten_text, _sanitize_for_speech
+from src.agent import _shorten_text
 from google.adk.runners import InMemoryRunner
 
 from src.voice_typing import start_voice_typing
@@ -25,6 +29,190 @@ from src.smart_writer import handle_smart_ai_writing
 logging.getLogger().handlers.clear()
 logging.getLogger().setLevel(logging.CRITICAL + 1)
 
+_DEVNULL = open(os.devnull, "w")
+
+_REQ_COUNTER = count(1)
+_content_parts = attrgetter("content.parts")
+
+_SHUTDOWN_RE = re.compile(r"\b(?:bye(?:[- ]?bye)?|shut[- ]?down)\b")
+_CODE_PLACEHOLDER = " I've put the full code in your chat window. "
+# Code fences, indented code lines and HTML tags, removed in one pass.
+_TTS_STRIP_RE = re.compile(r"(```.*?```)|(?:\A|(?<=\n)) {4,}[^\n]*|<[^<>]+>", re.DOTALL)
+_WHITESPACE_RE = re.compile(r"\s+")
+_TTS_MARKUP_RE = re.compile(r"```|[<&]|\s{2,}")
+_VOICE_TYPING_PHRASES = frozenset(("voice typing", "start voice typing"))
+_SEND_MESSAGE_PREFIXES = ("send a message", "send message")
+
+
+LISTEN_TIMEOUT_S = 5
+PHRASE_TIME_LIMIT_S = 10
+
+_AGENT = None
+_RUNNER: Optional[InMemoryRunner] = None
+_RUNNER_CLOSE: Optional[Callable[[], Any]] = None
+
+
+def _find_cleanup(obj: Any, *names: str) -> Optional[Callable[[], Any]]:
+    """Return the first callable attribute of obj among names, or None."""
+    for name in names:
+        fn = getattr(obj, name, None)
+        if callable(fn):
+            return fn
+    return None
+
+
+async def _run_cleanup(fn: Optional[Callable[[], Any]], what: str) -> None:
+    """Call a cleanup method found by _find_cleanup, awaiting it if needed."""
+    if fn is None:
+        return
+    try:
+        maybe = fn()
+        if inspect.isawaitable(maybe):
+            await maybe
+    except Exception:
+        logger.debug(f"{what} raised an exception during cleanup.")
+
+
+def _get_runner() -> InMemoryRunner:
+    """Build the ADK agent and runner on first use; later loop entries reuse them."""
+    global _AGENT, _RUNNER, _RUNNER_CLOSE
+    if _RUNNER is None:
+        _AGENT = create_axylo_agent()
+        _RUNNER = InMemoryRunner(agent=_AGENT)
+        _RUNNER.render_fn = lambda *args, **kwargs: None
+        _RUNNER.debug = False
+        _RUNNER_CLOSE = _find_cleanup(_RUNNER, "close", "shutdown")
+    return _RUNNER
+
+
+async def _close_runner() -> None:
+    """Close the cached runner (if any) and drop it so a later call rebuilds it."""
+    global _AGENT, _RUNNER, _RUNNER_CLOSE
+    close_fn, _AGENT, _RUNNER, _RUNNER_CLOSE = _RUNNER_CLOSE, None, None, None
+    await _run_cleanup(close_fn, "Runner close/shutdown")
+
+
+def _extract_final_text(result: Any) -> str:
+    """
+    Pull the reply text out of runner.run_debug()'s return value.
+    A single response object is the cheap case and is handled first;
+    event lists fall back to scanning for the final response.
+    """
+    if not isinstance(result, (list, tuple)):
+        if isinstance(result, str):
+            return result
+        try:
+            parts = _content_parts(result)
+        except AttributeError:
+            return ""
+        except Exception:
+            return str(result)
+        if not parts:
+            return ""
+        first = parts[0]
+        return getattr(first, "text", str(first)) or ""
+
+    # The last final response wins, so scan from the end and stop at the first hit.
+    for event in reversed(result):
+        is_final = getattr(event, "is_final_response", None)
+        if is_final is None:
+            continue
+        try:
+            if not is_final():
+                continue
+            parts = _content_parts(event)
+        except Exception:
+            continue
+        if parts:
+            return getattr(parts[0], "text", None) or ""
+    return ""
+
+
+async def _safe_speak(voice: VoiceHandler, text: str) -> None:
+    """Speak text, logging TTS failures instead of raising them."""
+    try:
+        await voice.speak(text)
+    except Exception as e:
+        logger.error(f"Voice speak failed: {e}")
+
+
+async def _handle_write(user_input: str, lower_input: str, voice: VoiceHandler) -> bool:
+    """"write ..." -> smart AI writer."""
+    if not lower_input.startswith("write "):
+        return False
+
+    await handle_smart_ai_writing(user_input, voice)
+    return True
+
+
+async def _handle_voice_typing(user_input: str, lower_input: str, voice: VoiceHandler) -> bool:
+    """"voice typing" -> dictation session in Notepad."""
+    if lower_input not in _VOICE_TYPING_PHRASES:
+        return False
+
+    await _safe_speak(voice, "Starting voice typing in Notepad.")
+    try:
+        await start_voice_typing(voice)
+    except Exception as e:
+        logger.error(f"Voice typing session error: {e}")
+        await _safe_speak(voice, "Voice typing failed because of an internal error.")
+    return True
+
+
+async def _handle_send_message(user_input: str, lower_input: str, voice: VoiceHandler) -> bool:
+    """"send a message [to X]" -> guided voice messaging session."""
+    if not lower_input.startswith(_SEND_MESSAGE_PREFIXES):
+        return False
+
+    _, sep, rest = lower_input.partition(" to ")
+    initial_recipient = rest.strip() if sep else None
+    await _safe_speak(voice, "Okay, I will help you send a message.")
+    try:
+        await start_voice_messaging(voice, initial_recipient=initial_recipient)
+    except Exception as e:
+        logger.error(f"Voice messaging session error: {e}")
+        await _safe_speak(voice, "Message sending failed because of an internal error.")
+    return True
+
+
+# Keyed by the first word of the utterance; each handler returns False
+# if the rest of the phrase does not match so the agent gets it instead.
+_COMMAND_TABLE = {
+    "write": _handle_write,
+    "voice": _handle_voice_typing,
+    "start": _handle_voice_typing,
+    "send": _handle_send_message,
+}
+
+
+async def _speak_while_listening(voice: VoiceHandler, text: str) -> asyncio.Future:
+    """
+    Speak a reply sentence by sentence with the next listen already started.
+    - The listener keeps the mic closed for as long as the reply is playing,
+      however long it is, so Axylo never transcribes its own voice; it opens
+      the mic as soon as playback ends, so no turnaround is lost after speaking.
+    - speak_streamed sets the speaking flag before its first await, and it is
+      scheduled before the listener, so the listener always sees it set.
+    Returns the listen task so the caller can await it as the next utterance.
+    The loop awaits this before handling another utterance, so at most one
+    reply is ever in flight and speak_streamed keeps only one sentence of
+    audio ahead of playback; TTS work cannot pile up behind the agent.
+    """
+    speak_task = asyncio.ensure_future(voice.speak_streamed(text))
+    listen_task = asyncio.ensure_future(
+        voice.listen_async(
+            timeout=LISTEN_TIMEOUT_S,
+            phrase_time_limit=PHRASE_TIME_LIMIT_S,
+            max_speech_wait=None,
+        )
+    )
+
+    try:
+        await speak_task
+    except Exception as e:
+        logger.error(f"Voice speak failed: {e}")
+    return listen_task
+
 
 async def run_agent_loop(shutdown_event: asyncio.Event):
     """
@@ -36,34 +224,48 @@ async def run_agent_loop(shutdown_event: asyncio.Event):
         voice.loop = asyncio.get_running_loop()
     except RuntimeError:
         voice.loop = None
+    voice_cleanup = _find_cleanup(voice, "cleanup_tempdir", "cleanup")
 
-    agent = create_axylo_agent()
-    runner = InMemoryRunner(agent=agent)
-
-    runner.render_fn = lambda *args, **kwargs: None
-    runner.debug = False
-
+    # Speak the greeting while the agent is built so the first real reply
+    # finds the mixer open and the TTS path already exercised.
+    greeting = asyncio.ensure_future(
+        _safe_speak(voice, "Hi! I'm Axylo. The voice of your smart world. How can I help you?")
+    )
     try:
-        await voice.speak("Hi! I'm Axylo. The voice of your smart world. How can I help you?")
-    except Exception as e:
-        logger.error(f"Startup speak failed: {e}")
+        runner = await asyncio.to_thread(_get_runner)
+    except BaseException:
+        greeting.cancel()
+        raise
+    await greeting
 
     consecutive_empty = 0
     MAX_EMPTY_BEFORE_SLEEP = 20
+    next_listen: Optional[asyncio.Future] = None
+    shutdown_wait = asyncio.ensure_future(shutdown_event.wait())
 
     try:
-        while not shutdown_event.is_set():
+        while True:
+            listen_task = next_listen or asyncio.ensure_future(
+                voice.listen_async(timeout=LISTEN_TIMEOUT_S, phrase_time_limit=PHRASE_TIME_LIMIT_S)
+            )
+            next_listen = None
+
+            # Shutdown wakes the loop straight away instead of after the listen returns.
+            done, _ = await asyncio.wait(
+                {listen_task, shutdown_wait}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if shutdown_wait in done:
+                listen_task.cancel()
+                break
+
             try:
-                user_input = await voice.listen_async(timeout=5, phrase_time_limit=10)
+                user_input = listen_task.result()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
                 logger.error(f"Listen error: {e}")
                 user_input = ""
 
-            if shutdown_event.is_set():
-                break
-
             if not user_input:
                 consecutive_empty += 1
                 if consecutive_empty >= MAX_EMPTY_BEFORE_SLEEP:
@@ -73,157 +275,55 @@ async def run_agent_loop(shutdown_event: asyncio.Event):
 
             consecutive_empty = 0
 
-            request_id = uuid.uuid4().hex[:8]
+            request_id = f"{next(_REQ_COUNTER):08x}"
             logger.set_request_id(request_id)
 
             try:
                 logger.user(user_input)
                 lower_input = user_input.strip().lower()
 
-                if (
-                    "bye" in lower_input
-                    or "bye bye" in lower_input
-                    or "byebye" in lower_input
-                    or "bye-bye" in lower_input
-                    or "shut down" in lower_input
-                    or "shutdown" in lower_input
-                    or "shut-down" in lower_input
-                ):
-                    try:
-                        await voice.speak("Bye!. Shutting down.")
-                    except Exception:
-                        pass
+                if _SHUTDOWN_RE.search(lower_input):
+                    await _safe_speak(voice, "Bye!. Shutting down.")
                     break
 
-                if lower_input.startswith("write "):
-                    await handle_smart_ai_writing(user_input, voice)
-                    continue
-
-                if lower_input in ("voice typing", "start voice typing"):
-                    try:
-                        await voice.speak("Starting voice typing in Notepad.")
-                    except Exception:
-                        pass
-                    try:
-                        await start_voice_typing(voice)
-                    except Exception as e:
-                        logger.error(f"Voice typing session error: {e}")
-                        try:
-                            await voice.speak("Voice typing failed because of an internal error.")
-                        except Exception:
-                            pass
-                    continue
-
-                if lower_input.startswith("send a message") or lower_input.startswith("send message"):
-                    initial_recipient = None
-                    if " to " in lower_input:
-                        try:
-                            initial_recipient = lower_input.split(" to ", 1)[1].strip()
-                        except Exception:
-                            initial_recipient = None
-                    try:
-                        await voice.speak("Okay, I will help you send a message.")
-                    except Exception:
-                        pass
-                    try:
-                        await start_voice_messaging(voice, initial_recipient=initial_recipient)
-                    except Exception as e:
-                        logger.error(f"Voice messaging session error: {e}")
-                        try:
-                            await voice.speak("Message sending failed because of an internal error.")
-                        except Exception:
-                            pass
+                handler = _COMMAND_TABLE.get(lower_input.partition(" ")[0])
+                if handler is not None and await handler(user_input, lower_input, voice):
                     continue
 
                 try:
-                    with open(os.devnull, "w") as devnull, \
-                         contextlib.redirect_stdout(devnull), \
-                         contextlib.redirect_stderr(devnull):
+                    with contextlib.redirect_stdout(_DEVNULL), \
+                         contextlib.redirect_stderr(_DEVNULL):
                         result = await runner.run_debug(user_input)
 
-                    final_text = ""
-
-                    if isinstance(result, (list, tuple)):
-                        for event in result:
-                            try:
-                                if hasattr(event, "is_final_response") and event.is_final_response():
-                                    if getattr(event, "content", None) and getattr(event.content, "parts", None):
-                                        final_text = event.content.parts[0].text
-                            except Exception:
-                                if isinstance(event, str):
-                                    final_text = event
-                    else:
-                        try:
-                            if hasattr(result, "content"):
-                                parts = getattr(result.content, "parts", None)
-                                if parts:
-                                    first = parts[0]
-                                    final_text = getattr(first, "text", str(first))
-                            elif isinstance(result, str):
-                                final_text = result
-                        except Exception:
-                            final_text = str(result)
+                    final_text = _extract_final_text(result)
 
                     if final_text:
                         logger.agent(final_text)
                         
                         tts_text = make_tts_friendly(final_text)
-    
-                        try:
-                            await voice.speak(final_text)
-                        except Exception as e:
-                            logger.error(f"Voice speak failed: {e}")
+
+                        next_listen = await _speak_while_listening(voice, tts_text)
                     else:
-                        try:
-                            await voice.speak("I couldn't parse the agent's response. Check logs.")
-                        except Exception:
-                            pass
+                        await _safe_speak(voice, "I couldn't parse the agent's response. Check logs.")
 
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
                     logger.error(f"Agent error: {e}")
-                    try:
-                        await voice.speak("I encountered an error executing that command.")
-                    except Exception:
-                        pass
+                    await _safe_speak(voice, "I encountered an error executing that command.")
 
             finally:
                 logger.set_request_id(None)
 
     except asyncio.CancelledError:
-        try:
-            await voice.speak("Shutting down.")
-        except Exception:
-            pass
+        await _safe_speak(voice, "Shutting down.")
     finally:
-        try:
-            close_fn = getattr(runner, "close", None) or getattr(runner, "shutdown", None)
-            if callable(close_fn):
-                try:
-                    maybe = close_fn()
-                    if asyncio.iscoroutine(maybe):
-                        await maybe
-                except Exception:
-                    logger.debug(
-                        "Runner close/shutdown raised an exception during cleanup.",
-                    )
-        except Exception:
-            pass
+        if next_listen is not None and not next_listen.done():
+            next_listen.cancel()
+        if not shutdown_wait.done():
+            shutdown_wait.cancel()
 
-        try:
-            cleanup_fn = getattr(voice, "cleanup_tempdir", None) or getattr(voice, "cleanup", None)
-            if callable(cleanup_fn):
-                try:
-                    maybe = cleanup_fn()
-                    if asyncio.iscoroutine(maybe):
-                        await maybe
-                except Exception:
-                    logger.debug(
-                        "Voice cleanup raised an exception during cleanup.",
-                    )
-        except Exception:
-            pass
+        await _run_cleanup(voice_cleanup, "Voice cleanup")
 
         logger.info("Agent loop has exited and cleanup completed.")
 
@@ -238,29 +338,32 @@ async def _main_with_signals():
         shutdown_event.set()
 
     loop = asyncio.get_running_loop()
+    if os.getenv("AXYLO_ASYNCIO_DEBUG"):
+        loop.set_debug(True)
+        loop.slow_callback_duration = 0.05
+
     try:
-        loop.add_signal_handler(signal.SIGINT, lambda: _signal_handler("SIGINT"))
+        loop.add_signal_handler(signal.SIGINT, _signal_handler, "SIGINT")
     except (NotImplementedError, RuntimeError):
         pass
     try:
-        loop.add_signal_handler(signal.SIGTERM, lambda: _signal_handler("SIGTERM"))
+        loop.add_signal_handler(signal.SIGTERM, _signal_handler, "SIGTERM")
     except (AttributeError, NotImplementedError, RuntimeError):
         pass
 
     agent_task = asyncio.create_task(run_agent_loop(shutdown_event))
 
     try:
-        await asyncio.wait({agent_task}, return_when=asyncio.FIRST_COMPLETED)
+        await asyncio.shield(agent_task)
     except asyncio.CancelledError:
-        if not agent_task.done():
-            agent_task.cancel()
-        raise
-    if not agent_task.done():
         agent_task.cancel()
-        try:
-            await agent_task
-        except Exception:
-            pass
+        await asyncio.gather(agent_task, return_exceptions=True)
+        raise
+    finally:
+        await _close_runner()
+
+def _tts_strip(match: "re.Match[str]") -> str:
+    return _CODE_PLACEHOLDER if match.group(1) else " "
 
 def make_tts_friendly(text: str, max_len: int = 450) -> str:
     """
@@ -271,15 +374,23 @@ def make_tts_friendly(text: str, max_len: int = 450) -> str:
     if not text:
         return ""
 
-    cleaned = re.sub(r"```.*?```", " I've put the full code in your chat window. ", text, flags=re.DOTALL)
-
-    cleaned = re.sub(r"(^|\n)( {4,}.*)", r"\1", cleaned)
+    if len(text) <= max_len and not _TTS_MARKUP_RE.search(text):
+        return text.strip()
 
-    cleaned = _sanitize_for_speech(cleaned)
-    cleaned = _shorten_text(cleaned, max_len=max_len)
-    return cleaned.strip()
+    if "&" in text:
+        text = html.unescape(text)
+    cleaned = _TTS_STRIP_RE.sub(_tts_strip, text)
+    cleaned = _WHITESPACE_RE.sub(" ", cleaned).strip()
+    return _shorten_text(cleaned, max_len=max_len).strip()
 
 if __name__ == "__main__":
+    # uvloop has no Windows build; there the default asyncio loop is used.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(_main_with_signals())
     except KeyboardInterrupt:
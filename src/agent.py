@@ -1,19 +1,18 @@
-from typing import Optional, Any, Dict
-from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
-from google.genai import types
+from typing import TYPE_CHECKING, Optional, Any, Dict
+from functools import lru_cache
 from dotenv import load_dotenv
+import asyncio
 import logging
 import html
 import re
 import subprocess
 import sys
 import os
-import webbrowser
 
 import src.logger as logger
 
 from src.user_profile import load_user_profile, format_profile_for_system_instruction
+from src.user_profile import _PROFILE_PATH
 
 from src.tools import control_app as _control_app
 from src.tools import control_media as _control_media
@@ -24,56 +23,96 @@ from src.tools import stop_auto_scroll as _stop_auto_scroll
 from src.tools import intelligent_web_search as _intelligent_web_search
 from src.tools import control_youtube as _control_youtube
 
-from src.sub_agents import run_research_agent_sync, run_code_agent_sync  # A2A helper
+# ADK/genai, the sub-agents and webbrowser are imported where they are used so
+# that importing this module for its text helpers stays cheap.
+if TYPE_CHECKING:
+    from google.adk.agents import LlmAgent
+    from google.adk.models.google_llm import Gemini
 
 load_dotenv()
 
-_HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
-_WHITESPACE_PATTERN = re.compile(r"\s+")
+# Excluding "<" from the tag body keeps a stray unclosed "<" from scanning to
+# the end of the text from every later "<" (quadratic on "<<<<..." input).
+_HTML_TAG_PATTERN = re.compile(r"<[^<>]+>")
 
-retry_config = types.HttpRetryOptions(
-    attempts=3,
-    exp_base=2,
-    initial_delay=1,
-    http_status_codes=[429, 500, 503],
-)
+_SUCCESS_RE = re.compile(r"success|opened|opening|launched|attempted", re.IGNORECASE)
+_FAIL_RE = re.compile(r"failed", re.IGNORECASE)
+_URL_SCHEME_RE = re.compile(r"https?://", re.IGNORECASE)
+
+# Caps on what is forwarded to the ResearchAgent's own LLM call.
+_RESEARCH_QUESTION_MAX = 2000
+_RESEARCH_CONTEXT_MAX = 12000
+
+# HttpRetryOptions.http_status_codes is a pydantic list[int] field, so any
+# set passed here is converted back into a list; a three-item list is fine.
+_RETRY_STATUS_CODES = [429, 500, 503]
 
+_VALID_SEARCH_MODES = frozenset(("terminal", "chrome"))
+
+_ERR_APP = "Failed to control application."
+_ERR_MEDIA = "Failed to control media."
+_ERR_TAB = "Failed to close the current tab."
+_ERR_SCROLL = "Failed to execute scroll command."
+_ERR_YT = "Failed to execute YouTube command."
+_ERR_WEB = "I could not fetch web results."
+
+_CHATBOT_SCRIPT = os.path.abspath(os.path.join(os.path.dirname(__file__), "chatbot_ui.py"))
+_CHATBOT_EXISTS = os.path.exists(_CHATBOT_SCRIPT)
 
 def _shorten_text(s: str, max_len: int = 800) -> str:
     """Optimized text shortening with early returns."""
     if not s or len(s) <= max_len:
         return s
-    shortened = s[: max_len - 3]
-    last_space = shortened.rfind(" ")
-    return (
-        shortened[:last_space] + "..."
-        if last_space > max_len // 2
-        else shortened + "..."
-    )
+    return _shorten_cached(s, max_len)
+
+
+@lru_cache(maxsize=256)
+def _shorten_cached(s: str, max_len: int) -> str:
+    """Long-string half of _shorten_text, memoized for results that get re-shortened."""
+    cut = max_len - 3
+    last_space = s.rfind(" ", 0, cut)
+    if last_space > max_len // 2:
+        return f"{s[:last_space]}..."
+    return f"{s[:cut]}..."
 
 
 def _sanitize_for_speech(s: str) -> str:
-    """Optimized HTML sanitization using pre-compiled patterns."""
+    """
+    Optimized HTML sanitization: entity decoding and tag stripping only run
+    when the text can contain them, and whitespace is collapsed by
+    str.split/join in a single C-level pass.
+    """
     if not s:
         return ""
-    text = html.unescape(s)
-    text = _HTML_TAG_PATTERN.sub(" ", text)
-    text = _WHITESPACE_PATTERN.sub(" ", text).strip()
-    return text
+    text = html.unescape(s) if "&" in s else s
+    if "<" in text:
+        text = _HTML_TAG_PATTERN.sub(" ", text)
+    return " ".join(text.split())
+
 
+def _result(ok: bool, msg: Any) -> Dict[str, Any]:
+    """{ok, message} tool result with a speech-safe message; str() only when needed."""
+    return {"ok": ok, "message": _sanitize_for_speech(msg if isinstance(msg, str) else str(msg))}
 
-def control_app_wrapper(app_name: str, action: str, url: Optional[str] = None) -> Dict[str, Any]:
+
+def _err(message: str) -> Dict[str, Any]:
+    """{ok: False, message} tool result for a fixed, already speech-safe message."""
+    return {"ok": False, "message": message}
+
+
+async def control_app_wrapper(app_name: str, action: str, url: Optional[str] = None) -> Dict[str, Any]:
     """
-    Wrapper around control_app with optional URL navigation.
+    Open or close a desktop application, optionally opening a URL in the browser.
     Returns: {ok: bool, message: str}
-    - If 'url' is provided and action == "open", we will:
-        1) Try to open the app (e.g., Chrome), then
-        2) Try to open the given URL in the browser.
+    - app_name: human-friendly app name, e.g. "chrome", "notepad", "word", "vscode".
+    - action: "open" or "close".
+    - url: only with action == "open"; the browser is sent to this URL as well,
+      e.g. "Open Chrome and go to gemini dot com" -> url="https://gemini.com".
     - The message ALWAYS reflects exactly what actually happened.
     """
 
     if not isinstance(app_name, str) or not isinstance(action, str):
-        return {"ok": False, "message": "Invalid parameters for control_app."}
+        return _err("Invalid parameters for control_app.")
 
     app_name_clean = app_name.strip()
     action_clean = action.strip().lower()
@@ -84,22 +123,27 @@ def control_app_wrapper(app_name: str, action: str, url: Optional[str] = None) -
     result_msg = ""
 
     try:
-        result_msg = _control_app(app_name_clean, action_clean)
-        result_lower = result_msg.lower()
-        app_ok = any(
-            indicator in result_lower
-            for indicator in ("success", "opened", "opening", "launched", "attempted")
-        )
-
+        jobs = [asyncio.to_thread(_control_app, app_name_clean, action_clean)]
         if url_clean and action_clean == "open":
-            if not url_clean.startswith(("http://", "https://")):
+            if not _URL_SCHEME_RE.match(url_clean):
                 url_clean = "https://" + url_clean
+            # The app launch and the URL open are independent; run them together.
+            import webbrowser
+
+            jobs.append(asyncio.to_thread(webbrowser.open, url_clean, 2))
 
-            try:
-                url_ok = bool(webbrowser.open(url_clean, new=2))
-            except Exception as e:
-                logger.error(f"control_app_wrapper URL open error: {e}")
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        result_msg = results[0]
+        if isinstance(result_msg, BaseException):
+            raise result_msg
+        app_ok = bool(_SUCCESS_RE.search(result_msg))
+
+        if len(results) > 1:
+            if isinstance(results[1], BaseException):
+                logger.error(f"control_app_wrapper URL open error: {results[1]}")
                 url_ok = False
+            else:
+                url_ok = bool(results[1])
 
         if url_clean and action_clean == "open":
             if app_ok and url_ok:
@@ -126,26 +170,27 @@ def control_app_wrapper(app_name: str, action: str, url: Optional[str] = None) -
             message = result_msg
             ok = app_ok
 
-        return {"ok": ok, "message": _sanitize_for_speech(str(message))}
+        return _result(ok, message)
     except Exception as e:
         logger.error(f"control_app_wrapper error: {e}")
-        return {"ok": False, "message": "Failed to control application."}
+        return _err(_ERR_APP)
 
 
-def control_media_wrapper(command: str) -> Dict[str, Any]:
-    """Simplified with direct return pattern."""
+async def control_media_wrapper(command: str) -> Dict[str, Any]:
+    """
+    Control system media keys / volume.
+    command: "volume_up", "volume_down", "mute", "play_pause", "stop",
+    "next_track", "previous_track", "seek_forward" or "seek_backward".
+    """
     try:
-        msg = _control_media(command)
-        return {
-            "ok": "failed" not in msg.lower(),
-            "message": _sanitize_for_speech(str(msg)),
-        }
+        msg = await asyncio.to_thread(_control_media, command)
+        return _result(not _FAIL_RE.search(msg), msg)
     except Exception as e:
         logger.error(f"control_media_wrapper error: {e}")
-        return {"ok": False, "message": "Failed to control media."}
+        return _err(_ERR_MEDIA)
 
 
-def close_tab_wrapper() -> Dict[str, Any]:
+async def close_tab_wrapper() -> Dict[str, Any]:
     """
     Close ONLY the currently focused tab.
     Use when user says:
@@ -154,26 +199,27 @@ def close_tab_wrapper() -> Dict[str, Any]:
     - "close that tab"
     """
     try:
-        msg = _close_current_tab()
-        ok = "failed" not in msg.lower()
-        return {"ok": ok, "message": _sanitize_for_speech(str(msg))}
+        msg = await asyncio.to_thread(_close_current_tab)
+        ok = not _FAIL_RE.search(msg)
+        return _result(ok, msg)
     except Exception as e:
         logger.error(f"close_tab_wrapper error: {e}")
-        return {"ok": False, "message": "Failed to close the current tab."}
+        return _err(_ERR_TAB)
 
 
-def control_scroll_wrapper(direction: str, count: int = 1) -> Dict[str, Any]:
-    """Wrapper for scroll control."""
+async def control_scroll_wrapper(direction: str, count: int = 1) -> Dict[str, Any]:
+    """
+    Scroll the focused window a finite amount.
+    direction: "up" or "down"; count: positive integer, larger scrolls further
+    (e.g. "a bit" -> 2, "more" -> 5).
+    """
     try:
-        c = max(1, int(count))
-        msg = _control_scroll(direction, c)
-        return {
-            "ok": "failed" not in msg.lower(),
-            "message": _sanitize_for_speech(str(msg)),
-        }
+        c = count if (type(count) is int and count >= 1) else max(1, int(count or 1))
+        msg = await asyncio.to_thread(_control_scroll, direction, c)
+        return _result(not _FAIL_RE.search(msg), msg)
     except Exception as e:
         logger.error(f"control_scroll_wrapper error: {e}")
-        return {"ok": False, "message": "Failed to execute scroll command."}
+        return _err(_ERR_SCROLL)
 
 
 def start_auto_scroll_wrapper(direction: str = "down", speed: str = "slow") -> str:
@@ -198,48 +244,43 @@ def stop_auto_scroll_wrapper() -> str:
     return _stop_auto_scroll()
 
 
-def intelligent_web_search_wrapper(query: str, mode: str = "terminal") -> Dict[str, Any]:
-    """Optimized with reduced string operations and early returns."""
+async def intelligent_web_search_wrapper(query: str, mode: str = "terminal") -> Dict[str, Any]:
+    """
+    Search the web, fetch pages, and summarize them.
+    Use for current/live information (news, prices, scores, who holds a role now).
+    - query: the search query; paraphrasing the user's intent is fine.
+    - mode: "terminal" returns the text to you; "chrome" opens a browser search page.
+    Returns: {ok, mode, result: cleaned text, speech: shortened TTS-friendly text}
+    """
     try:
         safe_q = _shorten_text(str(query), max_len=2800)
-        requested_mode = (
-            mode.lower()
-            if isinstance(mode, str) and mode.lower() in ("terminal", "chrome")
-            else "terminal"
-        )
+        mode_lower = mode.lower() if isinstance(mode, str) else ""
+        requested_mode = mode_lower if mode_lower in _VALID_SEARCH_MODES else "terminal"
 
-        raw = _intelligent_web_search(safe_q, mode=requested_mode)
-
-        if isinstance(raw, str):
-            clean = _sanitize_for_speech(raw)
-            speech_text = _shorten_text(clean, max_len=800)
-            return {
-                "ok": True,
-                "mode": requested_mode,
-                "result": clean,
-                "speech": speech_text,
-            }
-        else:
-            s = _sanitize_for_speech(str(raw))
-            return {
-                "ok": True,
-                "mode": requested_mode,
-                "result": s,
-                "speech": _shorten_text(s, 800),
-            }
+        raw = await asyncio.to_thread(_intelligent_web_search, safe_q, mode=requested_mode)
+
+        # One full sanitize pass; the speech text is a bounded slice of it.
+        clean = _sanitize_for_speech(raw if isinstance(raw, str) else str(raw))
+        return {
+            "ok": True,
+            "mode": requested_mode,
+            "result": clean,
+            "speech": _shorten_text(clean, max_len=800),
+        }
     except Exception as e:
         logger.error(f"intelligent_web_search_wrapper error: {e}")
         return {
             "ok": False,
             "mode": "terminal",
             "result": "",
-            "speech": "I could not fetch web results.",
+            "speech": _ERR_WEB,
         }
 
-def call_research_agent_tool(question: str, web_text: str) -> Dict[str, Any]:
+async def call_research_agent_tool(question: str, web_text: str) -> Dict[str, Any]:
     """
     A2A tool: main Axylo agent can call a separate ResearchAgent to
-    deeply analyze text (typically web search results).
+    deeply analyze text (typically web search results). Use it when text you
+    already have is long, complex, or multi-document.
 
     Parameters seen by the LLM:
         question: user's question or task.
@@ -254,7 +295,13 @@ def call_research_agent_tool(question: str, web_text: str) -> Dict[str, Any]:
         }
     """
     try:
-        answer = run_research_agent_sync(question=question, context_text=web_text)
+        from src.sub_agents import run_research_agent_sync
+
+        answer = await asyncio.to_thread(
+            run_research_agent_sync,
+            question=_shorten_text(str(question or ""), max_len=_RESEARCH_QUESTION_MAX),
+            context_text=_shorten_text(str(web_text or ""), max_len=_RESEARCH_CONTEXT_MAX),
+        )
         return {
             "ok": True,
             "answer": answer,
@@ -268,14 +315,48 @@ def call_research_agent_tool(question: str, web_text: str) -> Dict[str, Any]:
             "note": f"ResearchAgent encountered an error: {e}",
         }
         
-def call_code_agent_tool(
+async def search_and_research(question: str) -> Dict[str, Any]:
+    """
+    Search the web for the question and have the ResearchAgent analyze the
+    results, all in one tool call. Prefer this over intelligent_web_search_wrapper
+    followed by call_research_agent_tool when the user wants deep research or a
+    detailed analysis of a current topic.
+
+    Parameters seen by the LLM:
+        question: user's question or task.
+
+    Returns:
+        {
+            "ok": bool,
+            "answer": str,   # final answer from ResearchAgent
+            "raw": str,      # cleaned web text the answer was based on
+        }
+    """
+    try:
+        from src.sub_agents import run_research_agent_sync
+
+        safe_q = _shorten_text(str(question), max_len=2800)
+        raw = await asyncio.to_thread(_intelligent_web_search, safe_q, mode="terminal")
+        raw_text = _sanitize_for_speech(str(raw))
+        answer = await asyncio.to_thread(
+            run_research_agent_sync,
+            question=_shorten_text(str(question), max_len=_RESEARCH_QUESTION_MAX),
+            context_text=_shorten_text(raw_text, max_len=_RESEARCH_CONTEXT_MAX),
+        )
+        return {"ok": True, "answer": answer, "raw": raw_text}
+    except Exception as e:
+        logger.error(f"[A2A] search_and_research failed: {e}")
+        return {"ok": False, "answer": "", "raw": ""}
+
+async def call_code_agent_tool(
     task: str,
     language: str = "python",
     code_snippet: str = "",
 ) -> Dict[str, Any]:
     """
     A2A tool: main Axylo agent can call a separate CodeAgent to
-    handle coding-related tasks (write, refactor, explain, improve).
+    handle coding-related tasks (write, refactor, explain, improve, test).
+    Use it when the request is complex enough to need a structured answer.
 
     Parameters (seen by the LLM):
         task: natural language description of what you want to do
@@ -291,7 +372,11 @@ def call_code_agent_tool(
         }
     """
     try:
-        answer = run_code_agent_sync(task=task, language=language, code_context=code_snippet)
+        from src.sub_agents import run_code_agent_sync
+
+        answer = await asyncio.to_thread(
+            run_code_agent_sync, task=task, language=language, code_context=code_snippet
+        )
         return {
             "ok": True,
             "answer": answer,
@@ -305,26 +390,32 @@ def call_code_agent_tool(
             "note": f"CodeAgent encountered an error: {e}",
         }
 
-def control_youtube_wrapper(action: str, query: Optional[str] = None) -> Dict[str, Any]:
-    """Simplified wrapper with direct processing."""
+async def control_youtube_wrapper(action: str, query: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Control YouTube.
+    action: "play" (requires query: search and play a video), "pause", "resume",
+    "stop", "next", "previous", "seek_forward", "seek_backward", "fullscreen", "mute".
+    """
     try:
-        msg = _control_youtube(action, query)
-        return {"ok": True, "message": _sanitize_for_speech(str(msg))}
+        msg = await asyncio.to_thread(_control_youtube, action, query)
+        return _result(True, msg)
     except Exception as e:
         logger.error(f"control_youtube_wrapper error: {e}")
-        return {"ok": False, "message": "Failed to execute YouTube command."}
+        return _err(_ERR_YT)
 
 
-def open_chatbot_wrapper() -> dict:
-    """Optimized with path caching and better error handling."""
+async def open_chatbot_wrapper() -> dict:
+    """Launch the Axylo graphical chat interface ("open the chatbot window")."""
     try:
-        python_exe = sys.executable
-        script_path = os.path.join("src", "chatbot_ui.py")
-
-        if not os.path.exists(script_path):
-            return {"ok": False, "message": f"Chatbot script not found at {script_path}"}
-
-        subprocess.Popen([python_exe, script_path])
+        if not _CHATBOT_EXISTS:
+            return {"ok": False, "message": f"Chatbot script not found at {_CHATBOT_SCRIPT}"}
+
+        await asyncio.to_thread(
+            subprocess.Popen,
+            [sys.executable, _CHATBOT_SCRIPT],
+            close_fds=True,
+            start_new_session=True,
+        )
         return {"ok": True, "message": "Chatbot interface opened."}
     except Exception as e:
         return {"ok": False, "message": f"Failed to launch chatbot: {e}"}
@@ -390,11 +481,14 @@ If you cannot fully satisfy a request:
 =====================================================================
 
 When calling tools:
-- Use them exactly as documented in section 3 (function names and parameters).
+- Use them exactly as their descriptions specify (function names and parameters).
 - Base your description of what happened ONLY on the tool’s return values
   and the documented behavior.
 - If the tool reports failure, partial success, or “not found”, you MUST say that.
 - If something fails, be honest and suggest a simple manual workaround when appropriate.
+- When a request needs several independent tool calls (e.g. "open chrome and search X"
+  needs control_app_wrapper and intelligent_web_search_wrapper), emit them together in
+  the same turn instead of one per turn; they run concurrently.
 
 Ambiguous requests:
 - If a request is unclear and could map to multiple tools, ask a brief clarification
@@ -406,215 +500,24 @@ Uncertain information:
   most likely and briefly mention the uncertainty instead of fabricating precise details.
 
 =====================================================================
-3. TOOL DOCUMENTATION (AVAILABLE PYTHON FUNCTIONS)
+3. TOOL ETIQUETTE
 =====================================================================
 
-Call ONLY the following tool functions (plus any new ones that may be added later).
-Use the signatures exactly as shown.
-
----------------------------------------------------------------------
-3.1 control_app_wrapper(app_name, action, url=None)
----------------------------------------------------------------------
-Purpose:
-- Open or close desktop applications, and optionally open a URL in a browser.
-
-Parameters:
-- app_name: human-friendly app name, e.g. "chrome", "notepad", "word",
-  "excel", "powerpoint", "vscode".
-- action: "open" or "close".
-- url (optional, only when action == "open"):
-  If provided, it tries to navigate the browser to this URL after opening.
-
-Examples:
-- User: "Open Chrome"
-  → control_app_wrapper(app_name="chrome", action="open")
-- User: "Open Chrome and go to gemini dot com"
-  → control_app_wrapper(app_name="chrome", action="open", url="https://gemini.com")
-- User: "Open Word"
-  → control_app_wrapper(app_name="word", action="open")
-- User: "Close Excel"
-  → control_app_wrapper(app_name="excel", action="close")
-
-Rules:
-- If the returned message says the app is not installed, not found, or failed,
-  you MUST tell the user that; do not claim the app was opened or closed.
-- If URL navigation fails, do not claim you navigated to that site.
-
----------------------------------------------------------------------
-3.2 control_media_wrapper(command)
----------------------------------------------------------------------
-Purpose:
-- Control system media keys / volume.
-
-Supported commands:
-- "volume_up", "volume_down", "mute"
-- "play_pause", "stop"
-- "next_track", "previous_track"
-- "seek_forward", "seek_backward"
-
-Examples:
-- User: "Mute the system"
-  → control_media_wrapper("mute")
-- User: "Increase the volume"
-  → control_media_wrapper("volume_up")
-
----------------------------------------------------------------------
-3.3 close_tab_wrapper()
----------------------------------------------------------------------
-Purpose:
-- Close ONLY the currently focused tab or similar.
-
-Examples:
-- User: "Close this tab" / "Close current tab"
-  → close_tab_wrapper()
-
-Rules:
-- Do NOT say you closed the entire browser; say you closed the current tab.
-
----------------------------------------------------------------------
-3.4 control_scroll_wrapper(direction, count=1)
----------------------------------------------------------------------
-Purpose:
-- Scroll the focused window up or down a finite amount.
-
-Parameters:
-- direction: "up" or "down"
-- count: positive integer; larger values scroll further.
-
-Examples:
-- User: "Scroll down a bit"
-  → control_scroll_wrapper(direction="down", count=2)
-- User: "Scroll up more"
-  → control_scroll_wrapper(direction="up", count=5)
-
----------------------------------------------------------------------
-3.5 start_auto_scroll_wrapper(direction="down", speed="slow")
-     stop_auto_scroll_wrapper()
----------------------------------------------------------------------
-Purpose:
-- Continuous auto-scrolling until explicitly stopped.
-
-Examples:
-- User: "Scroll down slowly"
-  → start_auto_scroll_wrapper(direction="down", speed="slow")
-- User: "Stop scrolling"
-  → stop_auto_scroll_wrapper()
-
-Guidance:
-- After starting auto-scroll, it is helpful to briefly tell the user they can say
-  something like “stop scrolling” to stop it.
-
----------------------------------------------------------------------
-3.6 intelligent_web_search_wrapper(query, mode="terminal")
----------------------------------------------------------------------
-Purpose:
-- Perform real web search, fetch pages, and summarize them.
-
-Parameters:
-- query: the search query string (you may paraphrase user intent).
-- mode:
-  - "terminal": return summarized content as text for you to read.
-  - "chrome": open a browser search page for the user.
-
-Examples:
-- User: "Who is the current Prime Minister of the UK?"
-  → intelligent_web_search_wrapper("current Prime Minister of the United Kingdom", mode="terminal")
-- User: "Search this on Google in Chrome"
-  → intelligent_web_search_wrapper(user_question, mode="chrome")
-
-Using the result:
-- The tool returns fields such as:
-  - "result": cleaned text including QUICK_ANSWER, LLM_FALLBACK,
-    or CONTEXT_FROM_WEB style content.
-  - "speech": already-shortened, TTS-friendly text.
-- Read the returned text, then respond in your own words with a short, direct answer.
-- Do NOT just paste big blocks of the raw text back to the user.
-- For complex or long web results, you may:
-  1) Use intelligent_web_search_wrapper in "terminal" mode to get text.
-  2) Then call call_research_agent_tool(question, web_result_text) to have
-     a specialist agent analyze it.
-
----------------------------------------------------------------------
-3.7 call_research_agent_tool(question, web_text)
----------------------------------------------------------------------
-Purpose:
-- Call a separate specialist agent (ResearchAgent) to deeply analyze a chunk
-  of text, usually from web search, and produce a focused answer.
-
-Parameters:
-- question: the user's question or task.
-- web_text: the relevant text you want analyzed (e.g., web search results).
-
-When to use:
-- After using intelligent_web_search_wrapper when the result is long,
-  complex, or multi-document and you want a higher quality, focused answer.
-- When the user explicitly asks for "deep research" or a "detailed analysis".
-
-Using the result:
-- The tool returns:
-  - "answer": the text answer from ResearchAgent.
-- Read and use this "answer" as the basis for your final reply to the user.
-- You may say things like "After doing a deeper analysis..." but do not
-  mention internal agents or tools by name.
-  
----------------------------------------------------------------------
-3.8 call_code_agent_tool(task, language, code_snippet)
----------------------------------------------------------------------
-Purpose:
-- Call a separate specialist agent (CodeAgent) for programming-related tasks:
-  writing code, refactoring, explaining code, suggesting improvements and tests.
-
-Parameters:
-- task: natural language description of what to do.
-- language: optional hint like "python", "javascript", etc.
-- code_snippet: optional existing code to analyze or modify.
-
-When to use:
-- When the user asks for help writing, refactoring, optimizing, or explaining code.
-- When the user provides code and wants improvements, tests, or bug analysis.
-- When the coding request is complex enough that a dedicated agent would
-  produce a better structured answer.
-
-Using the result:
-- The tool returns "answer", which contains explanation and code.
-- Use that "answer" as the basis of your final reply to the user.
-- Do not mention CodeAgent or internal tools by name. Present the result
-  as your own explanation and code suggestion.
-
----------------------------------------------------------------------
-3.9 control_youtube_wrapper(action, query=None)
----------------------------------------------------------------------
-Purpose:
-- Control YouTube specifically.
-
-Common actions:
-- "play" (requires query): search & play a video.
-- "pause", "resume", "stop"
-- "next", "previous"
-- "seek_forward", "seek_backward"
-- "fullscreen"
-- "mute"
-
-Examples:
-- User: "Play lo-fi hip hop beats on YouTube"
-  → control_youtube_wrapper(action="play", query="lofi hip hop beats")
-- User: "Pause the YouTube video"
-  → control_youtube_wrapper(action="pause")
-
-Rules:
-- For play: always supply a meaningful search query.
-- For control actions: assume the active tab is YouTube, but still be honest if the
-  command might not take effect.
-
----------------------------------------------------------------------
-3.10 open_chatbot_wrapper()
----------------------------------------------------------------------
-Purpose:
-- Launch the Axylo graphical chat interface.
-
-Example:
-- User: "Open the chatbot window"
-  → open_chatbot_wrapper()
+Each tool comes with its own name, parameters, and description; call tools
+exactly as described there and never invent tools or parameters.
+
+- control_app_wrapper: if the result says the app is not installed, not found,
+  or failed, tell the user; never claim an app was opened/closed or a URL was
+  reached unless the result says so.
+- close_tab_wrapper closes only the current tab, never the whole browser.
+- After start_auto_scroll_wrapper, tell the user they can say “stop scrolling”.
+- intelligent_web_search_wrapper: read "result"/"speech" and answer in your own
+  words; do not paste big blocks of raw text back to the user.
+- call_research_agent_tool, search_and_research, call_code_agent_tool: base your
+  reply on the returned "answer" and present it as your own; never mention
+  internal agents or tools by name.
+- control_youtube_wrapper: "play" always needs a meaningful query; for other
+  actions assume the active tab is YouTube, but be honest that it may not take effect.
 
 =====================================================================
 4. WEB SEARCH vs LOCAL ANSWERING
@@ -631,6 +534,11 @@ Use intelligent_web_search_wrapper when:
   • live prices, stocks, sports scores, weather, or recent news.
 - The user explicitly says “search the web”, “search Google”, or similar.
 
+Use search_and_research instead when:
+- The user wants deep research or a detailed analysis of a live/current topic.
+- It searches and runs the research analysis in one call, so do not chain
+  intelligent_web_search_wrapper and call_research_agent_tool for these.
+
 If the user says “based on the browser results, answer this”:
 - Call intelligent_web_search_wrapper in "terminal" mode with an appropriate query,
   then answer using that text.
@@ -678,41 +586,79 @@ _TOOLS = [
     stop_auto_scroll_wrapper,
     intelligent_web_search_wrapper,
     call_research_agent_tool,
+    search_and_research,
     call_code_agent_tool,
     control_youtube_wrapper,
     open_chatbot_wrapper,
 ]
 
 
+_PROFILE_HEADER = (
+    "\n\n"
+    "=====================================================================\n"
+    "USER PROFILE (PERSONALIZATION CONTEXT)\n"
+    "=====================================================================\n"
+)
+_PROFILE_FOOTER = (
+    "\n\n"
+    "Use this profile only to personalize tone, examples, and suggestions "
+    "for this specific user. Do NOT invent extra personal details.\n"
+)
+
+_MODEL: Optional["Gemini"] = None
+# Keyed on the profile file's mtime (None when it doesn't exist), so saving
+# a new profile builds a fresh agent and everything else reuses the last one.
+_AGENT_CACHE: Dict[Optional[float], "LlmAgent"] = {}
+
+
+def _profile_mtime() -> Optional[float]:
+    try:
+        return os.path.getmtime(_PROFILE_PATH)
+    except OSError:
+        return None
+
+
+def _build_system_instruction() -> str:
+    try:
+        profile_snippet = format_profile_for_system_instruction(load_user_profile())
+    except Exception:
+        return _SYSTEM_INSTRUCTION
+    if not profile_snippet:
+        return _SYSTEM_INSTRUCTION
+    return "".join((_SYSTEM_INSTRUCTION, _PROFILE_HEADER, profile_snippet, _PROFILE_FOOTER))
+
+
 def create_axylo_agent():
     """
     Optimized agent initialization with cached components.
     Adds simple personalization based on a persisted user profile.
+    The model and agent are reused until the profile file changes.
     """
-    model = Gemini(model="gemini-2.0-flash", retry_options=retry_config)
+    global _MODEL
 
-    system_instruction = _SYSTEM_INSTRUCTION
+    cache_key = _profile_mtime()
+    cached = _AGENT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
-    try:
-        profile = load_user_profile()
-        profile_snippet = format_profile_for_system_instruction(profile)
-        if profile_snippet:
-            system_instruction = (
-                system_instruction
-                + "\n\n"
-                + "=====================================================================\n"
-                + "USER PROFILE (PERSONALIZATION CONTEXT)\n"
-                + "=====================================================================\n"
-                + profile_snippet
-                + "\n\n"
-                + "Use this profile only to personalize tone, examples, and suggestions "
-                + "for this specific user. Do NOT invent extra personal details.\n"
-            )
-    except Exception:
-        pass
+    from google.adk.agents import LlmAgent
+
+    if _MODEL is None:
+        from google.adk.models.google_llm import Gemini
+        from google.genai import types
+
+        retry_config = types.HttpRetryOptions(
+            attempts=3,
+            exp_base=2,
+            initial_delay=1,
+            http_status_codes=_RETRY_STATUS_CODES,
+        )
+        _MODEL = Gemini(model="gemini-2.0-flash", retry_options=retry_config)
+
+    system_instruction = _build_system_instruction()
 
     agent = LlmAgent(
-        model=model,
+        model=_MODEL,
         name="Axylo",
         description="A voice-controlled system automation assistant with robust web search.",
         instruction=system_instruction,
@@ -731,4 +677,31 @@ def create_axylo_agent():
     except Exception:
         pass
 
+    _AGENT_CACHE.clear()
+    _AGENT_CACHE[cache_key] = agent
     return agent
+
+
+async def close_axylo_agent() -> None:
+    """
+    Drop the cached model and agent and close the model's async HTTP client.
+    Await this on the event loop the agent ran on, before that loop is closed:
+    the client's pooled connections are bound to it, so the next loop must get
+    a fresh model instead of reusing them.
+    """
+    global _MODEL
+
+    model, _MODEL = _MODEL, None
+    _AGENT_CACHE.clear()
+    if model is None:
+        return
+
+    # api_client is a cached_property; only close it if it was ever built.
+    client = vars(model).get("api_client")
+    aclose = getattr(getattr(client, "aio", None), "aclose", None)
+    if aclose is None:
+        return
+    try:
+        await aclose()
+    except Exception as e:
+        logger.debug(f"Model client close failed: {e}")
@@ -1,12 +1,29 @@
 import os
 import sys
 import subprocess
-import glob
 import difflib
 import logging
 import json
+import mmap
 import platform
-from typing import Dict, Tuple, Optional, Any
+import re
+import tempfile
+import threading
+import time
+from itertools import count
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Optional, Any
+
+try:
+    from rapidfuzz import process as _rf_process, fuzz as _rf_fuzz
+except ImportError:
+    _rf_process = None
+
+try:
+    import pythoncom
+    import win32com.client as _win32_client
+except ImportError:
+    pythoncom = None
+    _win32_client = None
 
 try:
     import src.logger as logger
@@ -14,6 +31,29 @@ except ImportError:
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger("AppLauncher")
 
+INDEX_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "axylo", "apps.json")
+INDEX_CACHE_VERSION = 3
+# Packaged (UWP) apps are installed without touching the Start Menu folders
+# we stat, so on Windows the cache additionally expires after a week.
+WINDOWS_CACHE_MAX_AGE_S = 7 * 24 * 3600
+# How long a launch/close request waits for background indexing to finish.
+INDEX_READY_TIMEOUT_S = 5
+
+_MACOS_APP_DIRS = (
+    "/Applications",
+    "/System/Applications",
+    os.path.expanduser("~/Applications"),
+)
+_LINUX_DESKTOP_DIRS = (
+    "/usr/share/applications",
+    "/usr/local/share/applications",
+    os.path.expanduser("~/.local/share/applications"),
+)
+# First-match extraction of Name= / Exec= from a whole .desktop file in one pass.
+_DESKTOP_FIELD_RE = re.compile(rb"(?m)^(Name|Exec)=([^\r\n]*)")
+# Bytes read from a .desktop file that cannot be mmap'd (empty, /proc-style overlays).
+_DESKTOP_READ_LIMIT = 4096
+
 class AppLauncher:
     """
     Cross-platform, scalable application launcher/closer.
@@ -24,23 +64,43 @@ class AppLauncher:
         * refresh_index()        -> rebuild the index
         * find_and_launch(name)  -> open an app
         * find_and_close(name)   -> close an app (best-effort, using process name)
+    - The index is built on a background thread, so constructing the launcher
+      (and importing this module) does not block; lookups wait for it.
     """
 
     def __init__(self) -> None:
         self.os_type: str = platform.system()
         self.apps_cache: Dict[str, Dict[str, Any]] = {}
-        self.refresh_index()
+        self._keys: Tuple[str, ...] = ()
+        self._trigrams: Dict[str, Set[int]] = {}
+        self._trigram_counts: Tuple[int, ...] = ()
+        self._short_keys: Tuple[int, ...] = ()
+        self._ready = threading.Event()
+        threading.Thread(
+            target=self._build_and_set_ready,
+            name="app-indexer",
+            daemon=True,
+        ).start()
+
+    def _build_and_set_ready(self) -> None:
+        try:
+            if not self._load_cached_index():
+                self.refresh_index()
+        finally:
+            self._ready.set()
+
+    def _wait_until_ready(self) -> bool:
+        if self._ready.wait(timeout=INDEX_READY_TIMEOUT_S):
+            return True
+        logger.warning("App index is still being built; lookup skipped.")
+        return False
+
+    # Deletes separators and whitespace in a single C-level pass.
+    _NORM_TABLE = str.maketrans("", "", " -_\t\r\n\f\v")
 
     def _normalize(self, name: str) -> str:
         """Removes spaces, casing, and common punctuation for better matching."""
-        return (
-            (name or "")
-            .lower()
-            .replace(" ", "")
-            .replace("-", "")
-            .replace("_", "")
-            .strip()
-        )
+        return (name or "").lower().translate(self._NORM_TABLE)
 
     def refresh_index(self) -> None:
         """Builds the index of installed apps based on OS."""
@@ -59,7 +119,282 @@ class AppLauncher:
         except Exception as e:
             logger.error(f"Failed to index apps: {e}")
 
+        self._build_lookup()
+        if self.apps_cache:
+            self._save_cached_index()
+
+    def _watched_dirs(self) -> List[str]:
+        """Directories whose mtime changes when apps are (un)installed."""
+        if self.os_type == "Windows":
+            return [
+                os.path.join(root, "Microsoft", "Windows", "Start Menu", "Programs")
+                for root in (os.environ.get("APPDATA"), os.environ.get("ProgramData"))
+                if root
+            ]
+        if self.os_type == "Darwin":
+            return list(_MACOS_APP_DIRS)
+        if self.os_type == "Linux":
+            return list(_LINUX_DESKTOP_DIRS)
+        return []
+
+    @staticmethod
+    def _dir_mtimes(dirs: Iterable[str]) -> Dict[str, Optional[int]]:
+        """st_mtime_ns per directory; None for missing ones so they count too."""
+        mtimes: Dict[str, Optional[int]] = {}
+        for d in dirs:
+            try:
+                mtimes[d] = os.stat(d).st_mtime_ns
+            except OSError:
+                mtimes[d] = None
+        return mtimes
+
+    def _load_cached_index(self) -> bool:
+        """
+        Load the app index from INDEX_CACHE_PATH if it is still valid
+        (same OS, same watched-directory mtimes, and on Windows not too old).
+        Returns True when the cache was used; any malformed content returns
+        False so the caller re-indexes and overwrites the bad file.
+        """
+        try:
+            with open(INDEX_CACHE_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable app index cache: {e}")
+            return False
+
+        try:
+            if not isinstance(data, dict) or data.get("version") != INDEX_CACHE_VERSION:
+                return False
+            if data.get("os_type") != self.os_type:
+                return False
+            if data.get("mtimes") != self._dir_mtimes(self._watched_dirs()):
+                return False
+            if self.os_type == "Windows":
+                age = time.time() - float(data.get("created", 0))
+                if age > WINDOWS_CACHE_MAX_AGE_S:
+                    return False
+
+            cache = data.get("cache")
+            if not isinstance(cache, dict) or not cache:
+                return False
+            if not all(isinstance(info, dict) for info in cache.values()):
+                return False
+
+            self.apps_cache = cache
+            self._build_lookup()
+        except (TypeError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring malformed app index cache: {e}")
+            self.apps_cache = {}
+            return False
+
+        logger.info(f"Loaded {len(self.apps_cache)} applications from index cache.")
+        return True
+
+    def _save_cached_index(self) -> None:
+        """Write the app index to INDEX_CACHE_PATH atomically (temp file + os.replace)."""
+        payload = {
+            "version": INDEX_CACHE_VERSION,
+            "os_type": self.os_type,
+            "created": time.time(),
+            "mtimes": self._dir_mtimes(self._watched_dirs()),
+            "cache": self.apps_cache,
+        }
+        dirpath = os.path.dirname(INDEX_CACHE_PATH)
+        tmp_path = None
+        try:
+            os.makedirs(dirpath, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=dirpath, prefix=".tmp_apps_", suffix=".json")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, INDEX_CACHE_PATH)
+        except Exception as e:
+            logger.warning(f"Could not write app index cache: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _trigrams_of(key: str) -> Set[str]:
+        return {key[i:i + 3] for i in range(len(key) - 2)}
+
+    def _build_lookup(self) -> None:
+        """
+        Snapshot the index keys and build a trigram -> key-index posting map,
+        so queries only look at keys that share trigrams with them.
+        """
+        self._keys = tuple(self.apps_cache)
+        trigrams: Dict[str, Set[int]] = {}
+        counts = []
+        short = []
+        for idx, key in enumerate(self._keys):
+            grams = self._trigrams_of(key)
+            counts.append(len(grams))
+            if not grams:
+                short.append(idx)
+            for gram in grams:
+                trigrams.setdefault(gram, set()).add(idx)
+        self._trigrams = trigrams
+        self._trigram_counts = tuple(counts)
+        self._short_keys = tuple(short)
+
+    def _candidate_keys(self, query_norm: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Narrow the index for a normalized query.
+        Returns (substring_pool, fuzzy_pool):
+        - substring_pool: keys that could contain, or be contained in, the query
+        - fuzzy_pool: keys sharing at least one trigram (all keys if none do)
+        """
+        keys = self._keys
+        grams = self._trigrams_of(query_norm)
+        if not grams:
+            return keys, keys
+
+        hits: Dict[int, int] = {}
+        postings = self._trigrams
+        for gram in grams:
+            for idx in postings.get(gram, ()):
+                hits[idx] = hits.get(idx, 0) + 1
+        if not hits:
+            return tuple(keys[i] for i in self._short_keys), keys
+
+        # query in key needs every query trigram; key in query needs every key trigram.
+        want = len(grams)
+        counts = self._trigram_counts
+        substring_idx = [
+            idx for idx, n in hits.items() if n == want or n == counts[idx]
+        ]
+        substring_idx.extend(self._short_keys)
+        substring_pool = tuple(keys[i] for i in sorted(substring_idx))
+        fuzzy_pool = tuple(keys[i] for i in sorted(hits))
+        return substring_pool, fuzzy_pool
+
     def _index_windows(self) -> None:
+        """
+        Indexes Start Menu apps in-process when pywin32 is available,
+        falling back to PowerShell's Get-StartApps otherwise.
+        """
+        if _win32_client is not None:
+            try:
+                self._index_windows_native()
+            except Exception as e:
+                logger.warning(f"Native Start Menu indexing failed, using PowerShell: {e}")
+                self.apps_cache.clear()
+            if self.apps_cache:
+                return
+        self._index_windows_powershell()
+
+    def _index_windows_native(self) -> None:
+        """
+        Resolves Start Menu shortcuts (.lnk) through WScript.Shell and adds
+        packaged/UWP apps from the registry, without spawning PowerShell.
+        """
+        # Indexing runs on a worker thread, which needs its own COM apartment.
+        pythoncom.CoInitialize()
+        try:
+            shell = _win32_client.Dispatch("WScript.Shell")
+            for root in self._watched_dirs():
+                for lnk_path in self._iter_shortcuts(root):
+                    name = os.path.splitext(os.path.basename(lnk_path))[0]
+                    clean = self._normalize(name)
+                    if not clean or clean in self.apps_cache:
+                        continue
+
+                    try:
+                        target = shell.CreateShortCut(lnk_path).TargetPath or ""
+                    except Exception:
+                        target = ""
+                    process_name: Optional[str] = None
+                    if target.lower().endswith(".exe"):
+                        process_name = os.path.basename(target)
+
+                    self.apps_cache[clean] = {
+                        "real_name": name,
+                        "launch_cmd": lnk_path,
+                        "type": "shell",
+                        "process_name": process_name,
+                    }
+        finally:
+            pythoncom.CoUninitialize()
+
+        self._index_windows_packages()
+
+    @staticmethod
+    def _iter_shortcuts(root: str) -> Iterator[str]:
+        """Yields every .lnk under root (recursive, via os.scandir)."""
+        pending = [root]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.lower().endswith(".lnk"):
+                        yield entry.path
+
+    def _index_windows_packages(self) -> None:
+        """
+        Adds packaged (UWP) apps registered for the current user, read from
+        HKCU\\Software\\Classes\\ActivatableClasses\\Package\\<package>\\Server\\<id>.
+        The display name is derived from the package name
+        (e.g. Microsoft.WindowsCalculator -> WindowsCalculator).
+        """
+        import winreg
+
+        def subkeys(key: Any) -> Iterator[str]:
+            for i in count():
+                try:
+                    yield winreg.EnumKey(key, i)
+                except OSError:
+                    return
+
+        def value(key: Any, name: str) -> Optional[str]:
+            try:
+                return winreg.QueryValueEx(key, name)[0]
+            except OSError:
+                return None
+
+        base = r"Software\Classes\ActivatableClasses\Package"
+        try:
+            packages = winreg.OpenKey(winreg.HKEY_CURRENT_USER, base)
+        except OSError:
+            return
+
+        with packages:
+            for package in subkeys(packages):
+                name = package.split("_", 1)[0].rsplit(".", 1)[-1]
+                clean = self._normalize(name)
+                if not clean or clean in self.apps_cache:
+                    continue
+                try:
+                    servers = winreg.OpenKey(packages, package + r"\Server")
+                except OSError:
+                    continue
+                with servers:
+                    for server in subkeys(servers):
+                        with winreg.OpenKey(servers, server) as server_key:
+                            app_id = value(server_key, "AppUserModelId")
+                            exe_path = value(server_key, "ExePath") or ""
+                        if not app_id:
+                            continue
+                        process_name: Optional[str] = None
+                        if exe_path.lower().endswith(".exe"):
+                            process_name = os.path.basename(exe_path)
+                        self.apps_cache[clean] = {
+                            "real_name": name,
+                            "launch_cmd": f"shell:AppsFolder\\{app_id}",
+                            "type": "shell",
+                            "process_name": process_name,
+                        }
+                        break
+
+    def _index_windows_powershell(self) -> None:
         """
         Uses PowerShell to get Start Menu apps.
         Robustness fixes:
@@ -116,7 +451,7 @@ class AppLauncher:
 
                 self.apps_cache[clean] = {
                     "real_name": name,
-                    "launch_cmd": f"explorer.exe shell:AppsFolder\\{app_id}",
+                    "launch_cmd": f"shell:AppsFolder\\{app_id}",
                     "type": "shell",
                     "process_name": process_name,
                 }
@@ -125,48 +460,50 @@ class AppLauncher:
 
     def _index_macos(self) -> None:
         """Scans standard Application folders."""
-        app_dirs = [
-            "/Applications",
-            "/System/Applications",
-            os.path.expanduser("~/Applications"),
-        ]
-        for d in app_dirs:
-            if not os.path.exists(d):
+        normalize = self._normalize
+        cache = self.apps_cache
+        for d in _MACOS_APP_DIRS:
+            try:
+                entries = os.scandir(d)
+            except OSError:
                 continue
-            for app_path in glob.glob(os.path.join(d, "*.app")):
-                filename = os.path.basename(app_path)
-                name = filename.replace(".app", "")
-                clean = self._normalize(name)
-
-                self.apps_cache[clean] = {
-                    "real_name": name,
-                    "launch_cmd": ["open", app_path],
-                    "type": "subprocess",
-                    "process_name": name,
-                }
+            with entries:
+                for entry in entries:
+                    filename = entry.name
+                    if not filename.endswith(".app") or not entry.is_dir():
+                        continue
+                    name = filename.replace(".app", "")
+
+                    cache[normalize(name)] = {
+                        "real_name": name,
+                        "launch_cmd": ["open", entry.path],
+                        "type": "subprocess",
+                        "process_name": name,
+                    }
 
     def _index_linux(self) -> None:
         """Parses .desktop files in standard locations."""
-        desktop_dirs = [
-            "/usr/share/applications",
-            "/usr/local/share/applications",
-            os.path.expanduser("~/.local/share/applications"),
-        ]
+        for d in _LINUX_DESKTOP_DIRS:
+            try:
+                entries = os.scandir(d)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if not entry.name.endswith(".desktop"):
+                        continue
+                    try:
+                        fields = self._read_desktop_fields(entry.path)
+                        name = fields.get(b"Name")
+                        exec_raw = fields.get(b"Exec")
+                        if not name or not exec_raw:
+                            continue
+
+                        name = name.decode("utf-8", "ignore").strip()
+                        exec_cmd = exec_raw.decode("utf-8", "ignore").split("%")[0].strip()
+                        if not name or not exec_cmd:
+                            continue
 
-        for d in desktop_dirs:
-            for filepath in glob.glob(os.path.join(d, "*.desktop")):
-                try:
-                    name: Optional[str] = None
-                    exec_cmd: Optional[str] = None
-                    with open(filepath, "r", errors="ignore") as f:
-                        for line in f:
-                            if line.startswith("Name=") and not name:
-                                name = line.strip().split("=", 1)[1]
-                            if line.startswith("Exec=") and not exec_cmd:
-                                exec_cmd = line.strip().split("=", 1)[1]
-                                exec_cmd = exec_cmd.split("%")[0].strip()
-
-                    if name and exec_cmd:
                         clean = self._normalize(name)
                         first_token = exec_cmd.split()[0]
                         process_name = os.path.basename(first_token)
@@ -177,8 +514,35 @@ class AppLauncher:
                             "type": "subprocess",
                             "process_name": process_name,
                         }
-                except Exception:
-                    continue
+                    except Exception:
+                        continue
+
+    @staticmethod
+    def _read_desktop_fields(path: str) -> Dict[bytes, bytes]:
+        """
+        Return the first Name= and Exec= values (raw bytes) of a .desktop file.
+        mmaps the file; if that is not possible, falls back to reading its
+        first _DESKTOP_READ_LIMIT bytes.
+        """
+        fields: Dict[bytes, bytes] = {}
+
+        def collect(data: Any) -> None:
+            for m in _DESKTOP_FIELD_RE.finditer(data):
+                fields.setdefault(m.group(1), m.group(2))
+                if len(fields) == 2:
+                    return
+
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    collect(mm)
+            finally:
+                os.close(fd)
+        except (OSError, ValueError):
+            with open(path, "rb") as f:
+                collect(f.read(_DESKTOP_READ_LIMIT))
+        return fields
 
     def _resolve_app_info(self, user_query: str) -> Optional[Dict[str, Any]]:
         """
@@ -193,20 +557,20 @@ class AppLauncher:
         if query_norm in self.apps_cache:
             return self.apps_cache[query_norm]
 
-        candidates = [
-            (key, info)
-            for key, info in self.apps_cache.items()
-            if query_norm in key or key in query_norm
-        ]
-        if candidates:
-            best_key, best_info = sorted(candidates, key=lambda x: len(x[0]))[0]
-            return best_info
+        substring_pool, fuzzy_pool = self._candidate_keys(query_norm)
+
+        # Shortest key wins; first seen on ties (same as a stable sort by length).
+        best_key: Optional[str] = None
+        best_len = sys.maxsize
+        for key in substring_pool:
+            if len(key) < best_len and (query_norm in key or key in query_norm):
+                best_key, best_len = key, len(key)
+        if best_key is not None:
+            return self.apps_cache[best_key]
 
-        keys = list(self.apps_cache.keys())
-        matches = difflib.get_close_matches(query_norm, keys, n=1, cutoff=0.65)
+        best_match_key = self._fuzzy_match(query_norm, fuzzy_pool)
 
-        if matches:
-            best_match_key = matches[0]
+        if best_match_key:
             app_info = self.apps_cache[best_match_key]
             logger.info(
                 f"Fuzzy matched '{user_query}' ({query_norm}) -> "
@@ -216,18 +580,45 @@ class AppLauncher:
 
         return None
 
+    def _fuzzy_match(self, query_norm: str, keys: Iterable[str]) -> Optional[str]:
+        """
+        Closest of keys to query_norm with a ratio of at least 0.65.
+        Uses RapidFuzz when installed, otherwise difflib.
+        """
+        if _rf_process is not None:
+            match = _rf_process.extractOne(
+                query_norm,
+                keys,
+                scorer=_rf_fuzz.ratio,
+                score_cutoff=65,
+            )
+            return match[0] if match else None
+
+        matches = difflib.get_close_matches(
+            query_norm, keys, n=1, cutoff=0.65
+        )
+        return matches[0] if matches else None
+
     def find_and_launch(self, user_query: str) -> Tuple[bool, str]:
         """
         Resolve and launch an app by name.
         Returns: (success: bool, message: str)
         """
+        if not self._wait_until_ready():
+            return False, "Still indexing installed applications, please try again in a moment."
         app_info = self._resolve_app_info(user_query)
         if not app_info:
             return False, f"Could not find an app named '{user_query}'."
         return self._execute(app_info)
 
     def _execute(self, app_info: Dict[str, Any]) -> Tuple[bool, str]:
-        """Safely executes the launch command."""
+        """
+        Safely executes the launch command without an intermediate shell.
+        - "shell" entries (Windows) hold a shell target (shortcut path or
+          shell:AppsFolder\\<AppID>) and are opened with os.startfile.
+        - "subprocess" entries hold an argv list and are started detached,
+          in their own session, so they outlive Axylo.
+        """
         real_name = app_info.get("real_name", "the app")
         cmd = app_info.get("launch_cmd")
 
@@ -235,9 +626,16 @@ class AppLauncher:
 
         try:
             if app_info.get("type") == "shell":
-                subprocess.Popen(cmd, shell=True)
+                os.startfile(cmd)
             else:
-                subprocess.Popen(cmd)
+                subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True,
+                    start_new_session=True,
+                )
             return True, f"Opening {real_name}..."
         except Exception as e:
             logger.error(f"Launch failed for {real_name}: {e}")
@@ -290,6 +688,8 @@ class AppLauncher:
         Resolve and close an app by name using the dynamic index.
         Returns: (success: bool, message: str)
         """
+        if not self._wait_until_ready():
+            return False, "Still indexing installed applications, please try again in a moment."
         app_info = self._resolve_app_info(user_query)
         if not app_info:
             return False, f"Could not find an app named '{user_query}'."
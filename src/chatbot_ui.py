@@ -2,8 +2,10 @@ import sys
 import os
 import threading
 import asyncio
+import concurrent.futures
 import logging
-import datetime
+import time
+from itertools import count
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(current_dir, ".."))
@@ -33,6 +35,14 @@ INPUT_FONT = ("Consolas", 13)
 BUTTON_FONT = ("Segoe UI", 12, "bold")
 META_FONT = ("Segoe UI", 9)
 
+_VOICE_TYPING_PHRASES = frozenset(("voice typing", "start voice typing"))
+_SEND_MESSAGE_PREFIXES = ("send a message", "send message")
+
+_CHAT_USER_ID = "chat_user"
+_TURN_COUNTER = count(1)
+# Upper bound on one agent turn; research-heavy replies can take a while.
+AGENT_REPLY_TIMEOUT_S = 120
+
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
 
@@ -52,6 +62,19 @@ class ChatbotWindow(ctk.CTk):
         self.grid_rowconfigure(1, weight=1)
 
         self.agent_factory = create_axylo_agent
+        self._agent = None
+        self._runner = None
+        self._agent_lock = threading.Lock()
+
+        # One event loop for the lifetime of the window, so the model client's
+        # connections survive between turns instead of dying with asyncio.run().
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=self._loop.run_forever,
+            name="chat-agent-loop",
+            daemon=True,
+        ).start()
+        self._scroll_pending = False
 
         self.top_bar = ctk.CTkFrame(
             self,
@@ -74,7 +97,7 @@ class ChatbotWindow(ctk.CTk):
             self.top_bar,
             text="●",
             font=("Segoe UI", 18, "bold"),
-            text_color=ACCENT_PRIMARY,
+            text_color=ACCENT_SECONDARY,
         )
         self.status_dot.grid(row=0, column=1, padx=(0, 18), pady=(10, 0), sticky="e")
 
@@ -178,9 +201,20 @@ class ChatbotWindow(ctk.CTk):
         )
 
         self._status_pulse_state = True
-        self.after(600, self._pulse_status_dot)
+        self._processing = False
+        self._pulse_job = None
 
     def _pulse_status_dot(self):
+        """Blink the status dot while a request is in flight; idle means no timer at all."""
+        self._pulse_job = None
+        if not self._processing:
+            self._status_pulse_state = True
+            try:
+                self.status_dot.configure(text_color=ACCENT_SECONDARY)
+            except Exception:
+                pass
+            return
+
         try:
             self._status_pulse_state = not self._status_pulse_state
             self.status_dot.configure(
@@ -188,14 +222,14 @@ class ChatbotWindow(ctk.CTk):
             )
         except Exception:
             pass
-        self.after(600, self._pulse_status_dot)
+        self._pulse_job = self.after(600, self._pulse_status_dot)
 
     def display_message(self, text, sender="bot"):
         """Displays a styled message bubble."""
         if not text:
             return
 
-        timestamp = datetime.datetime.now().strftime("%H:%M")
+        timestamp = time.strftime("%H:%M")
 
         if sender == "user":
             bg_color = USER_BUBBLE
@@ -270,6 +304,16 @@ class ChatbotWindow(ctk.CTk):
             )
             copy_btn.pack(side="left" if sender == "bot" else "right")
 
+        self._schedule_scroll()
+
+    def _schedule_scroll(self):
+        """Coalesce relayout + scroll-to-bottom for a burst of messages into one idle pass."""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.after_idle(self._flush_scroll)
+
+    def _flush_scroll(self):
+        self._scroll_pending = False
         self.update_idletasks()
         try:
             self.chat_frame._parent_canvas.yview_moveto(1.0)
@@ -299,11 +343,18 @@ class ChatbotWindow(ctk.CTk):
             self.entry.configure(state="disabled")
             self.send_btn.configure(state="disabled", text="Thinking…")
             self.set_typing(True)
+            self._processing = True
+            if self._pulse_job is None:
+                self._pulse_status_dot()
         else:
             self.entry.configure(state="normal")
             self.send_btn.configure(state="normal", text="Send")
             self.entry.focus()
             self.set_typing(False)
+            self._processing = False
+            if self._pulse_job is not None:
+                self.after_cancel(self._pulse_job)
+            self._pulse_status_dot()
 
     def start_processing(self, event=None):
         user_text = self.entry.get()
@@ -312,7 +363,7 @@ class ChatbotWindow(ctk.CTk):
             
         lower_text = user_text.strip().lower()
 
-        if lower_text.startswith("send a message") or lower_text.startswith("send message"):
+        if lower_text.startswith(_SEND_MESSAGE_PREFIXES):
             self.display_message(
                 "Messaging requires voice interaction.\n"
                 "Please say this using the voice agent: “send a message to <name>”.",
@@ -321,7 +372,7 @@ class ChatbotWindow(ctk.CTk):
             self.entry.delete(0, "end")
             return   
 
-        if lower_text in ("voice typing", "start voice typing"):
+        if lower_text in _VOICE_TYPING_PHRASES:
             self.display_message(
                 "Voice typing is available only in voice mode.\n"
                 "Try speaking the command instead.",
@@ -348,30 +399,44 @@ class ChatbotWindow(ctk.CTk):
             daemon=True,
         ).start()
 
+    def _get_runner(self):
+        """
+        Return the shared runner, building it on first use.
+        agent_factory() is cached (it only rebuilds when the user profile
+        changes), so a new runner is made only when the agent itself changed.
+        """
+        with self._agent_lock:
+            agent = self.agent_factory()
+            if self._runner is None or agent is not self._agent:
+                runner = InMemoryRunner(agent=agent)
+                runner.render_fn = lambda *args, **kwargs: None
+                self._agent, self._runner = agent, runner
+            return self._runner
+
+    def _reset_runner(self):
+        with self._agent_lock:
+            self._agent = None
+            self._runner = None
+
     def run_agent_stateless(self, user_text):
         response_text = ""
-        agent = None
 
         try:
-            agent = self.agent_factory()
-            runner = InMemoryRunner(agent=agent)
-            runner.render_fn = lambda *args, **kwargs: None
-            response_text = asyncio.run(self._get_adk_response(runner, user_text))
+            runner = self._get_runner()
+            fut = asyncio.run_coroutine_threadsafe(
+                self._get_adk_response(runner, user_text), self._loop
+            )
+            try:
+                response_text = fut.result(timeout=AGENT_REPLY_TIMEOUT_S)
+            except concurrent.futures.TimeoutError:
+                fut.cancel()
+                response_text = "Sorry, that took too long. Please try again."
 
         except Exception as e:
+            self._reset_runner()
             response_text = f"Error: {str(e)}"
 
         finally:
-            if agent:
-                try:
-                    if hasattr(agent, "model") and hasattr(agent.model, "_client"):
-                        asyncio.run(agent.model._client.close())
-                    elif hasattr(agent, "model") and hasattr(agent.model, "client"):
-                        if hasattr(agent.model.client, "close"):
-                            asyncio.run(agent.model.client.close())
-                except Exception:
-                    pass
-
             self.after(0, lambda: self._finish_processing(response_text))
 
     def _finish_processing(self, text):
@@ -383,8 +448,13 @@ class ChatbotWindow(ctk.CTk):
         Robustly extracts the final text response from the ADK event stream.
         This handles list outputs, single objects, and nested content parts.
         """
+        # Each turn gets its own session on the shared runner, so turns stay
+        # independent; the session is dropped once the reply is extracted.
+        session_id = f"chat-{next(_TURN_COUNTER)}"
         try:
-            events = await runner.run_debug(text)
+            events = await runner.run_debug(
+                text, user_id=_CHAT_USER_ID, session_id=session_id
+            )
 
             final_text = ""
 
@@ -400,8 +470,19 @@ class ChatbotWindow(ctk.CTk):
             return final_text if final_text else "I couldn't generate a response."
 
         except Exception as e:
+            self._reset_runner()
             return f"Processing Error: {str(e)}"
 
+        finally:
+            try:
+                await runner.session_service.delete_session(
+                    app_name=runner.app_name,
+                    user_id=_CHAT_USER_ID,
+                    session_id=session_id,
+                )
+            except Exception:
+                pass
+
     def _extract_text_from_event(self, event):
         """Helper to dig into an event object and find text."""
         if hasattr(event, "content") and event.content:
@@ -2,6 +2,7 @@ import os
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
 
 import asyncio
+import re
 import tempfile
 import threading
 import time
@@ -10,7 +11,8 @@ import logging
 import platform
 import subprocess
 import shutil
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 try:
     import src.logger as logger
@@ -38,6 +40,12 @@ try:
 except Exception:
     sr = None
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+
+def split_sentences(text: str) -> List[str]:
+    """Split text on sentence-ending punctuation and newlines, dropping blanks."""
+    return [s.strip() for s in _SENTENCE_SPLIT_RE.split(text or "") if s.strip()]
+
 class VoiceHandler:
     """
     Compatible replacement for original voice_io.VoiceHandler with improved robustness.
@@ -45,6 +53,7 @@ class VoiceHandler:
       - listen_async(timeout, phrase_time_limit)
       - listen_sync()
       - speak(text, voice=None, filename=None)  # async
+      - speak_streamed(text, voice=None)        # async, sentence by sentence
       - speak_sync(text)                        # sync wrapper
 
     IMPORTANT BEHAVIOR:
@@ -79,6 +88,8 @@ class VoiceHandler:
         self._speaking_flag = threading.Event() 
         self._post_speech_silence = 0.4 
         self._stop_playback_flag = threading.Event() 
+        self._stop_generation = 0
+        self._listen_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="voice-listen")
 
     def cleanup_tempdir(self):
         try:
@@ -103,13 +114,20 @@ class VoiceHandler:
             self._mixer_ready = False
             logger.error(f"Warning: pygame.mixer init failed: {e}")
 
-    async def listen_async(self, timeout: float = 5.0, phrase_time_limit: float = 10.0) -> str:
+    async def listen_async(
+        self,
+        timeout: float = 5.0,
+        phrase_time_limit: float = 10.0,
+        max_speech_wait: Optional[float] = 10.0,
+    ) -> str:
         """
         Async wrapper around blocking speech_recognition listen/recognize functions.
         Returns recognized text (empty string on failure).
 
         Guarantees:
-        - Will NOT listen while TTS is speaking (see _speaking_flag).
+        - Will NOT listen while TTS is speaking (see _speaking_flag), for up to
+          max_speech_wait seconds; None waits until speaking has finished,
+          however long the reply is.
         - Only one concurrent listener can use the mic (see _listen_lock).
         """
         if sr is None or self.recognizer is None or self.mic is None:
@@ -117,9 +135,16 @@ class VoiceHandler:
             return ""
 
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._listen_blocking, timeout, phrase_time_limit)
-
-    def _listen_blocking(self, timeout: float, phrase_time_limit: float) -> str:
+        return await loop.run_in_executor(
+            self._listen_executor, self._listen_blocking, timeout, phrase_time_limit, max_speech_wait
+        )
+
+    def _listen_blocking(
+        self,
+        timeout: float,
+        phrase_time_limit: float,
+        max_speech_wait: Optional[float] = 10.0,
+    ) -> str:
         """
         Blocking listening function using speech_recognition.
         Uses Google free recognizer and returns empty string on errors.
@@ -131,9 +156,8 @@ class VoiceHandler:
         if self.recognizer is None or self.mic is None:
             return ""
         
-        max_wait = 10.0  
         waited = 0.0
-        while self._speaking_flag.is_set() and waited < max_wait:
+        while self._speaking_flag.is_set() and (max_speech_wait is None or waited < max_speech_wait):
             time.sleep(0.05)
             waited += 0.05
             
@@ -198,15 +222,7 @@ class VoiceHandler:
             
         self._speaking_flag.set()
         try:
-            if edge_tts is not None:
-                try:
-                    communicate = edge_tts.Communicate(text, voice_to_use)
-                    await communicate.save(out_path)
-                except Exception as e:
-                    logger.error(f"Edge-TTS failed: {e}")
-                    await self._gtts_fallback_async(text, out_path)
-            else:
-                await self._gtts_fallback_async(text, out_path)
+            await self._synthesize(text, voice_to_use, out_path)
 
             try:
                 loop = asyncio.get_running_loop()
@@ -222,6 +238,75 @@ class VoiceHandler:
 
             self._speaking_flag.clear()
 
+    async def speak_streamed(self, text: str, voice: Optional[str] = None):
+        """
+        Speak text one sentence at a time. The next sentence is synthesized
+        while the current one plays, so audio starts after the first sentence
+        is ready instead of after the whole reply has been converted.
+        stop_speaking() abandons the remaining sentences.
+        """
+        sentences = split_sentences(text)
+        if not sentences:
+            return
+
+        voice_to_use = voice or self.tts_voice
+        generation = self._stop_generation
+        loop = asyncio.get_running_loop()
+        paths: List[str] = []
+
+        def next_path() -> str:
+            fd, path = tempfile.mkstemp(suffix=".mp3", prefix="edge_tts_", dir=self._temp_dir)
+            os.close(fd)
+            paths.append(path)
+            return path
+
+        path = next_path()
+        pending = asyncio.ensure_future(self._synthesize(sentences[0], voice_to_use, path))
+
+        self._speaking_flag.set()
+        try:
+            for i in range(len(sentences)):
+                await pending
+                current = path
+                if i + 1 < len(sentences):
+                    path = next_path()
+                    pending = asyncio.ensure_future(
+                        self._synthesize(sentences[i + 1], voice_to_use, path)
+                    )
+
+                if generation != self._stop_generation:
+                    break
+                try:
+                    await loop.run_in_executor(None, self._play_blocking, current)
+                except Exception as e:
+                    logger.error(f"Playback failed: {e}")
+                if generation != self._stop_generation:
+                    break
+        finally:
+            if not pending.done():
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+            for p in paths:
+                try:
+                    if os.path.exists(p):
+                        os.remove(p)
+                except Exception:
+                    pass
+
+            self._speaking_flag.clear()
+
+    async def _synthesize(self, text: str, voice_to_use: str, out_path: str):
+        """Write TTS audio for text to out_path, falling back to gTTS if Edge-TTS fails."""
+        if edge_tts is not None:
+            try:
+                communicate = edge_tts.Communicate(text, voice_to_use)
+                await communicate.save(out_path)
+            except Exception as e:
+                logger.error(f"Edge-TTS failed: {e}")
+                await self._gtts_fallback_async(text, out_path)
+        else:
+            await self._gtts_fallback_async(text, out_path)
+
     async def _gtts_fallback_async(self, text: str, out_path: str):
         """
         Run gTTS save inside executor (blocking operation off the event loop).
@@ -294,6 +379,7 @@ class VoiceHandler:
         Safe to call from GUI thread.
         """
         try:
+            self._stop_generation += 1
             self._stop_playback_flag.set()
             if pygame is not None and pygame.mixer.get_init():
                 with self._mixer_lock:
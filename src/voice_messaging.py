@@ -162,7 +162,7 @@ async def _email_flow(voice, initial_recipient: Optional[str]) -> None:
     gmail_url = "https://mail.google.com/mail/u/0/#inbox?compose=new"
 
     try:
-        msg = control_app("chrome", "open")
+        msg = await asyncio.to_thread(control_app, "chrome", "open")
         logger.tools(f"[VoiceMsg] control_app(chrome, open) -> {msg}")
     except Exception as e:
         logger.error(f"[VoiceMsg] Failed to open Chrome for Gmail: {e}")
@@ -207,12 +207,15 @@ async def _email_flow(voice, initial_recipient: Optional[str]) -> None:
 
     await _safe_speak(voice, f"You said: {message_body}. I will prepare the email.")
 
-    try:
+    def _fill_compose_form() -> None:
         pyautogui.typewrite(email_address, interval=0.03)
         pyautogui.press("tab")
         pyautogui.typewrite("Voice message from Axylo", interval=0.03)
         pyautogui.press("tab")
         pyautogui.typewrite(message_body, interval=0.03)
+
+    try:
+        await asyncio.to_thread(_fill_compose_form)
     except Exception as e:
         logger.error(f"[VoiceMsg] Failed to type into Gmail: {e}")
         await _safe_speak(voice, "I had trouble typing the email into Gmail.")
@@ -255,7 +258,7 @@ async def _whatsapp_flow(voice, initial_recipient: Optional[str]) -> None:
     whatsapp_url = "https://web.whatsapp.com/"
 
     try:
-        msg = control_app("chrome", "open")
+        msg = await asyncio.to_thread(control_app, "chrome", "open")
         logger.tools(f"[VoiceMsg] control_app(chrome, open) -> {msg}")
     except Exception as e:
         logger.error(f"[VoiceMsg] Failed to open Chrome for WhatsApp: {e}")
@@ -307,7 +310,7 @@ async def _whatsapp_flow(voice, initial_recipient: Optional[str]) -> None:
     await _safe_speak(voice, f"You said: {message_body}. I will type it in WhatsApp.")
 
     try:
-        pyautogui.typewrite(message_body, interval=0.03)
+        await asyncio.to_thread(pyautogui.typewrite, message_body, interval=0.03)
     except Exception as e:
         logger.error(f"[VoiceMsg] Failed to type WhatsApp message: {e}")
         await _safe_speak(voice, "I couldn't type the message into WhatsApp.")
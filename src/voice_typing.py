@@ -55,7 +55,7 @@ async def start_voice_typing(voice) -> None:
     - Starts continuous dictation to Notepad.
     """
     try:
-        msg = control_app("notepad", "open")
+        msg = await asyncio.to_thread(control_app, "notepad", "open")
         logger.tools(f"[VoiceTyping] control_app(notepad, open) -> {msg}")
     except Exception as e:
         logger.error(f"[VoiceTyping] Error opening Notepad: {e}")
@@ -98,24 +98,24 @@ async def voice_typing_session(voice) -> None:
             break
 
         if cmd in NEXT_LINE_CMDS:
-            _press_key("enter")
+            await asyncio.to_thread(_press_key, "enter")
             typed_buffer += "\n"
             continue
 
         if cmd in BACKSPACE_CMDS:
-            _press_key("backspace")
+            await asyncio.to_thread(_press_key, "backspace")
             if typed_buffer:
                 typed_buffer = typed_buffer[:-1]
             continue
 
         if cmd in DEL_WORD_CMDS:
             typed_buffer, backspaces = _delete_last_word(typed_buffer)
-            _press_backspaces(backspaces)
+            await asyncio.to_thread(_press_backspaces, backspaces)
             continue
 
         if cmd in DEL_SENT_CMDS:
             typed_buffer, backspaces = _delete_last_sentence(typed_buffer)
-            _press_backspaces(backspaces)
+            await asyncio.to_thread(_press_backspaces, backspaces)
             continue
 
         if cmd in SAVE_CMDS:
@@ -134,7 +134,7 @@ async def voice_typing_session(voice) -> None:
             continue
 
         to_type = raw_text + " "
-        _type_text(to_type)
+        await asyncio.to_thread(_type_text, to_type)
         typed_buffer += to_type
 
 
@@ -257,7 +257,9 @@ async def _ask_and_save_file(voice, buffer: str) -> None:
             )
             continue
 
-        ok, full_path, err_msg = _write_buffer_to_directory(buffer, directory)
+        ok, full_path, err_msg = await asyncio.to_thread(
+            _write_buffer_to_directory, buffer, directory
+        )
         if ok:
             LAST_SAVED_PATH = full_path
             await _safe_speak(voice, "File saved successfully.")